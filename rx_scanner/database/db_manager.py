@@ -5,96 +5,289 @@
 
 import logging
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
 
+# デフォルトのDBファイルパス（プロジェクトルート/data/medicine_data.db）
+DEFAULT_DB_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "medicine_data.db"
+)
+
+# 頻出クエリ（同一の文字列オブジェクトを渡して接続のステートメントキャッシュを再利用）
+# 部分一致の検索結果のうち、前方一致するものを先頭にしてから関連度順に並べる
+# FTS側で並び替え・件数制限してから薬剤マスタと結合する（上位LIMIT件のみ行を取得）
+SEARCH_SQL = """
+    SELECT m.* FROM (
+        SELECT
+            rowid,
+            (medicine_name LIKE ? ESCAPE '\\'
+                OR ingredient_name LIKE ? ESCAPE '\\') AS is_prefix,
+            rank
+        FROM medicines_fts
+        WHERE medicines_fts MATCH ?
+        ORDER BY is_prefix DESC, rank
+        LIMIT ?
+    ) fts
+    JOIN medicines m ON m.id = fts.rowid
+    ORDER BY fts.is_prefix DESC, fts.rank
+"""
+
+# トライグラムで検索できない短い語（3文字未満）を含む場合の部分一致検索（全件走査）
+# {conditions}には語ごとのSUBSTRING_CONDITION_SQLをANDで連結したものが入る
+SUBSTRING_SEARCH_SQL = """
+    SELECT * FROM medicines
+    WHERE {conditions}
+    ORDER BY
+        (medicine_name LIKE ? ESCAPE '\\' OR ingredient_name LIKE ? ESCAPE '\\') DESC,
+        medicine_name
+    LIMIT ?
+"""
+
+SUBSTRING_CONDITION_SQL = (
+    "(medicine_name LIKE ? ESCAPE '\\' OR ingredient_name LIKE ? ESCAPE '\\')"
+)
+
+ALTERNATIVES_SQL = """
+    SELECT * FROM medicines
+    WHERE ingredient_name = ? AND medicine_name != ?
+    ORDER BY medicine_type, price ASC
+"""
+
+# 一括挿入時の列順
+MEDICINE_COLUMNS = (
+    "classification",
+    "ingredient_name",
+    "specification",
+    "medicine_name",
+    "manufacturer",
+    "price",
+    "medicine_type",
+)
+
+INSERT_SQL = f"""
+    INSERT INTO medicines ({", ".join(MEDICINE_COLUMNS)})
+    VALUES ({", ".join("?" * len(MEDICINE_COLUMNS))})
+"""
+
+# 成分名の完全一致検索 + 代替薬剤の並び順用インデックス
+INGREDIENT_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_ingredient_sort
+    ON medicines(ingredient_name, medicine_type, price)
+"""
+
+# trigram: 日本語の薬剤名は空白で区切られず1語になるため、3文字単位で索引化して
+# 名前の途中（例: 'ピリン' → 'アスピリン錠'）でも検索できるようにする
+FTS_CREATE_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS medicines_fts USING fts5(
+        medicine_name,
+        ingredient_name,
+        content="medicines",
+        content_rowid="id",
+        tokenize="trigram"
+    )
+"""
+
+# 関連度の重み付け（薬剤名の一致を成分名の一致より優先）
+FTS_RANK_SQL = """
+    INSERT INTO medicines_fts (medicines_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0)')
+"""
+
+FTS_POPULATE_SQL = """
+    INSERT INTO medicines_fts (rowid, medicine_name, ingredient_name)
+    SELECT id, medicine_name, ingredient_name FROM medicines
+"""
+
 
 class DatabaseManager:
     """薬剤DB管理クラス"""
 
-    def __init__(self, db_path: str | None = None):
+    # 接続ごとに適用するPRAGMA（journal_mode=WALはDBファイルに永続化されるため別扱い）
+    # synchronousはコンストラクタで指定（WALではNORMALでも破損しない）
+    CONNECTION_PRAGMAS = (
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",  # 64MiB
+        "PRAGMA mmap_size=268435456",  # 256MiB
+        "PRAGMA foreign_keys=ON",
+    )
+
+    # 指定可能なsynchronousレベル
+    SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+    # スキーマのバージョン（PRAGMA user_versionに記録）
+    SCHEMA_VERSION = 2
+
+    # FTS5（トライグラム）で検索できる語の最小文字数
+    FTS_MIN_TERM_LENGTH = 3
+
+    # 検索結果キャッシュの最大件数
+    SEARCH_CACHE_SIZE = 512
+
+    # 一括挿入時のチャンクサイズ
+    INSERT_CHUNK_SIZE = 10_000
+
+    # WALモード設定済みのDBファイル
+    _wal_enabled_paths: set[Path] = set()
+
+    def __init__(self, db_path: str | None = None, synchronous: str = "NORMAL"):
         """
         Args:
             db_path: DBファイルパス（指定なしの場合はデフォルト）
+            synchronous: PRAGMA synchronousのレベル（耐久性を優先する場合はFULL）
+
+        Raises:
+            ValueError: synchronousのレベルが不正な場合
         """
         self.logger = logging.getLogger(__name__)
 
+        synchronous = synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronousの指定が不正です: {synchronous}")
+        self.synchronous = synchronous
+
         if db_path is None:
-            project_root = Path(__file__).resolve().parent.parent.parent
-            self.db_path = project_root / "data" / "medicine_data.db"
+            self.db_path = DEFAULT_DB_PATH
         else:
             self.db_path = Path(db_path)
 
+        # 全スレッドで共有する接続（初回アクセス時に生成）と排他ロック
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+        # 統計情報キャッシュ（data_version, 統計情報）
+        self._stats_cache: tuple[int, dict] | None = None
+
+        # 検索結果キャッシュ（(クエリ, 件数上限) → 検索結果、LRU）とそのdata_version
+        self._search_cache: OrderedDict[tuple[str, int], list[dict]] = OrderedDict()
+        self._search_cache_version: int | None = None
+
         # DB初期化
         self.init_database()
 
     @contextmanager
     def get_connection(self):
-        """DB接続のコンテキストマネージャー"""
-        conn = None
+        """
+        DB接続のコンテキストマネージャー
 
-        try:
-            conn = sqlite3.connect(self.db_path, timeout=5.0)
-            conn.row_factory = sqlite3.Row
-            yield conn
-
-        except sqlite3.Error as e:
-            if conn:
-                try:
-                    conn.rollback()
-                except Exception:
-                    pass
-            self.logger.error(f"Database error: {e}")
-            raise RuntimeError(f"DBエラー: {e}") from e
+        1本の接続を全スレッドで共有し、ロックで利用を直列化する（closeはしない）
+        """
+        with self._lock:
+            conn = None
+
+            try:
+                conn = self._get_shared_connection()
+                yield conn
+
+            except sqlite3.Error as e:
+                if conn:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                self.logger.error(f"Database error: {e}")
+                raise RuntimeError(f"DBエラー: {e}") from e
+
+            except Exception as e:
+                if conn:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                self.logger.error(f"Unexpected database error: {e}")
+                raise
+
+    def close(self):
+        """共有DB接続を閉じる"""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self):
+        """インスタンス破棄時に共有DB接続を閉じる"""
+        # __init__が途中で失敗した場合は属性が存在しない
+        if getattr(self, "_conn", None) is not None:
+            self._conn.close()
+
+    def _get_shared_connection(self) -> sqlite3.Connection:
+        """共有接続を取得（初回アクセス時に生成・設定）"""
+        if self._conn is None:
+            # isolation_level=None: 暗黙のトランザクションを使わず明示的に管理
+            # check_same_thread=False: ロックで直列化した上でスレッド間で共有
+            self._conn = sqlite3.connect(
+                self.db_path,
+                timeout=5.0,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            self._configure_connection(self._conn)
+        return self._conn
 
-        except Exception as e:
-            if conn:
-                try:
-                    conn.rollback()
-                except Exception:
-                    pass
-            self.logger.error(f"Unexpected database error: {e}")
-            raise
-
-        finally:
-            if conn:
-                conn.close()
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """接続にPRAGMAを適用"""
+        # WALモードはDBヘッダーに永続化されるのでファイルごとに1回のみ設定
+        if self.db_path not in self._wal_enabled_paths:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled_paths.add(self.db_path)
+
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
 
     def init_database(self):
-        """DBテーブルの初期化"""
+        """DBテーブルの初期化（スキーマが最新の場合は何もしない）"""
         with self.get_connection() as conn:
-            # 薬剤マスタテーブル作成
-            conn.execute("""
-            CREATE TABLE IF NOT EXISTS medicines (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                classification TEXT NOT NULL,
-                ingredient_name TEXT NOT NULL,
-                specification TEXT NOT NULL,
-                medicine_name TEXT NOT NULL,
-                manufacturer TEXT NOT NULL,
-                price REAL NOT NULL,
-                medicine_type TEXT NOT NULL,
-                created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
-            )
-            """)
-
-            # インデックス作成（ingredient_nameの完全一致検索用）
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ingredient_name
-                ON medicines(ingredient_name)
-            """)
-
-            # FTS用の仮想テーブル
-            conn.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS medicines_fts USING fts5(
-                medicine_name,
-                ingredient_name,
-                content="medicines",
-                content_rowid="id"
-            )
-            """)
+            # PRAGMA user_versionでスキーマのバージョンを管理
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version >= self.SCHEMA_VERSION:
+                self.logger.debug(f"Database schema is up to date: v{user_version}")
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 薬剤マスタテーブル作成
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS medicines (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    classification TEXT NOT NULL,
+                    ingredient_name TEXT NOT NULL,
+                    specification TEXT NOT NULL,
+                    medicine_name TEXT NOT NULL,
+                    manufacturer TEXT NOT NULL,
+                    price REAL NOT NULL,
+                    medicine_type TEXT NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+                )
+                """)
+
+                # インデックス作成（ingredient_nameの完全一致検索 + 代替薬剤の並び順用）
+                conn.execute(INGREDIENT_INDEX_SQL)
+
+                # 複合インデックスで代替されるため旧インデックスは削除
+                conn.execute("DROP INDEX IF EXISTS idx_ingredient_name")
+
+                # FTS用の仮想テーブル（トライグラムでない旧定義は作り直す）
+                row = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = 'medicines_fts'"
+                ).fetchone()
+                if row is None or "trigram" not in row[0]:
+                    conn.execute("DROP TABLE IF EXISTS medicines_fts")
+                    conn.execute(FTS_CREATE_SQL)
+                    conn.execute(FTS_RANK_SQL)
+                    conn.execute(FTS_POPULATE_SQL)
+                    self.logger.info("FTS table created")
+
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
 
-            conn.commit()
             self.logger.info("Database initialized successfully")
 
     def search_medicines(self, query: str, limit: int = 50) -> list[dict]:
@@ -108,24 +301,125 @@ class DatabaseManager:
         Returns:
             検索結果のリスト
         """
-        query = query.strip()
+        return self.search_medicines_batch([query], limit)[query]
 
-        if not query or len(query) < 2:
-            return []
+    def search_medicines_batch(
+        self, queries: Iterable[str], limit: int = 50
+    ) -> dict[str, list[dict]]:
+        """
+        複数クエリの薬剤検索を1回のロック取得・1トランザクションでまとめて実行
+
+        Args:
+            queries: 検索クエリのリスト（重複は1回だけ検索）
+            limit: クエリごとの結果件数上限
+
+        Returns:
+            クエリ → 検索結果のリストの辞書
+        """
+        results_by_query: dict[str, list[dict]] = {}
 
         with self.get_connection() as conn:
-            # 検索クエリのFTS5全文検索（関連度スコア順）
-            sql = """
-                SELECT m.* from medicines m
-                JOIN medicines_fts fts ON m.id = fts.rowid
-                WHERE medicines_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
-            """
-            cursor = conn.execute(sql, (f'"{query}"*', limit))
-            results = [dict(row) for row in cursor.fetchall()]
-            self.logger.info(f"Search '{query}' returned {len(results)} results")
-        return results
+            # 他プロセスによる更新があればキャッシュを破棄
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._search_cache_version:
+                self._search_cache.clear()
+                self._search_cache_version = data_version
+
+            in_transaction = False
+            try:
+                for original_query in queries:
+                    if original_query in results_by_query:
+                        continue
+
+                    query = original_query.strip()
+                    if not query or len(query) < 2:
+                        results_by_query[original_query] = []
+                        continue
+
+                    key = (query, limit)
+                    results = self._search_cache.get(key)
+                    if results is not None:
+                        self._search_cache.move_to_end(key)
+                    else:
+                        # 未キャッシュの検索は同一スナップショット上でまとめて実行
+                        if not in_transaction:
+                            conn.execute("BEGIN")
+                            in_transaction = True
+
+                        sql, params = self._build_search_query(query, limit)
+                        cursor = conn.execute(sql, params)
+                        results = self._fetch_dicts(cursor)
+                        self.logger.info(
+                            f"Search '{query}' returned {len(results)} results"
+                        )
+
+                        self._search_cache[key] = results
+                        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                            self._search_cache.popitem(last=False)
+
+                    results_by_query[original_query] = results
+            finally:
+                if in_transaction:
+                    conn.execute("COMMIT")
+
+        # 呼び出し側で結果の辞書を変更してもキャッシュに影響しないようコピーを返す
+        return {
+            query: [dict(result) for result in results]
+            for query, results in results_by_query.items()
+        }
+
+    @staticmethod
+    def _fetch_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+        """
+        結果行を辞書のリストに変換
+
+        列名はcursor.descriptionから1回だけ取得し、タプル行と組み合わせる
+        （sqlite3.Rowを行ごとに生成・変換するより軽量）
+        fetchall()の中間リストを作らずカーソルを直接走査する
+        """
+        keys = [column[0] for column in cursor.description]
+        return [dict(zip(keys, row, strict=True)) for row in cursor]
+
+    @classmethod
+    def _build_search_query(cls, query: str, limit: int) -> tuple[str, tuple]:
+        """
+        検索クエリから実行するSQLとパラメータを組み立て
+
+        空白区切りの各語の部分一致によるAND検索
+        すべての語が3文字以上ならFTS5（トライグラム）のMATCH式で検索し、
+        3文字未満の語を含む場合はLIKEで全件走査する
+        どちらも先頭の語で前方一致する薬剤を先に並べる
+
+        Args:
+            query: 前後の空白を除去済みの検索クエリ
+            limit: 結果件数上限
+
+        Returns:
+            (SQL, パラメータ)のタプル
+        """
+        terms = query.split()
+        prefix_pattern = cls._escape_like(terms[0]) + "%"
+
+        if all(len(term) >= cls.FTS_MIN_TERM_LENGTH for term in terms):
+            # 各語をダブルクォートでエスケープしたフレーズのAND検索
+            # 例: 'アムロ ベシル' → '"アムロ" "ベシル"'
+            match_query = " ".join(
+                '"' + term.replace('"', '""') + '"' for term in terms
+            )
+            return SEARCH_SQL, (prefix_pattern, prefix_pattern, match_query, limit)
+
+        conditions = " AND ".join(SUBSTRING_CONDITION_SQL for _ in terms)
+        params = []
+        for term in terms:
+            pattern = "%" + cls._escape_like(term) + "%"
+            params += (pattern, pattern)
+        params += (prefix_pattern, prefix_pattern, limit)
+        return SUBSTRING_SEARCH_SQL.format(conditions=conditions), tuple(params)
+
+    @staticmethod
+    def _escape_like(term: str) -> str:
+        """LIKEパターンの特殊文字（\\, %, _）をエスケープ"""
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
     def get_medicine_alternatives(
         self, ingredient_name: str, exclude_medicine_name: str
@@ -142,21 +436,11 @@ class DatabaseManager:
         """
         try:
             with self.get_connection() as conn:
-                # 同一成分の全薬剤を取得（価格順）
-                sql = """
-                    SELECT * FROM medicines
-                    WHERE ingredient_name = ?
-                    ORDER BY medicine_type, price ASC
-                """
-                cursor = conn.execute(sql, (ingredient_name,))
-                same_ingredient_medicines = [dict(row) for row in cursor.fetchall()]
-
-                # 除外薬剤以外を代替薬剤として抽出
-                alternatives = [
-                    medicine
-                    for medicine in same_ingredient_medicines
-                    if medicine["medicine_name"] != exclude_medicine_name
-                ]
+                # 除外薬剤以外の同一成分薬剤を取得（価格順）
+                cursor = conn.execute(
+                    ALTERNATIVES_SQL, (ingredient_name, exclude_medicine_name)
+                )
+                alternatives = self._fetch_dicts(cursor)
 
                 self.logger.info(
                     f"Found {len(alternatives)} alternatives "
@@ -189,52 +473,81 @@ class DatabaseManager:
         if not medicines:
             raise ValueError("置換データが指定されていません")
 
-        with self.get_connection() as conn:
-            self.logger.info(
-                f"Starting full medicine replacement: {len(medicines)} records"
-            )
+        self.logger.info(
+            f"Starting full medicine replacement: {len(medicines)} records"
+        )
+        return self.replace_all_medicines_iter(self._iter_medicine_rows(medicines))
+
+    def replace_all_medicines_iter(
+        self, rows: Iterable[tuple], chunksize: int | None = None
+    ) -> int:
+        """
+        薬剤マスタ全体の置換（タプルのストリームから挿入）
+
+        辞書のリストを経由せず、MEDICINE_COLUMNSの列順のタプルを
+        チャンク単位でexecutemanyに渡す
+
+        Args:
+            rows: MEDICINE_COLUMNSの列順の薬剤データタプル
+            chunksize: 1回のexecutemanyで挿入する件数（指定なしの場合はデフォルト）
+
+        Returns:
+            挿入された件数
 
-            # 1.既存データを全削除
-            sql = "DELETE FROM medicines"
-            conn.execute(sql)
-            self.logger.debug("Existing medicine data deleted")
-
-            # 2.FTSテーブルを全削除
-            sql = "DELETE FROM medicines_fts"
-            conn.execute(sql)
-            self.logger.debug("FTS table deleted")
-
-            # 3.新しいデータを一括挿入
-            insert_data = []
-            for medicine in medicines:
-                insert_data.append(
-                    (
-                        medicine.get("classification"),
-                        medicine.get("ingredient_name"),
-                        medicine.get("specification"),
-                        medicine.get("medicine_name"),
-                        medicine.get("manufacturer"),
-                        medicine.get("price"),
-                        medicine.get("medicine_type"),
-                    )
+        Raises:
+            ValueError: データが空の場合
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            raise ValueError("置換データが指定されていません")
+        rows = chain((first_row,), rows)
+
+        chunksize = chunksize or self.INSERT_CHUNK_SIZE
+
+        with self.get_connection() as conn:
+            # 全処理を1トランザクションで実行（書き込みロックを最初に取得）
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 1.インデックスを削除（行ごとの更新を避け、挿入後にまとめて構築）
+                conn.execute("DROP INDEX IF EXISTS idx_ingredient_sort")
+
+                # 2.既存データを全削除
+                sql = "DELETE FROM medicines"
+                conn.execute(sql)
+                self.logger.debug("Existing medicine data deleted")
+
+                # 3.FTSインデックスを全削除（外部コンテンツ型のためdelete-allを使用）
+                sql = "INSERT INTO medicines_fts(medicines_fts) VALUES('delete-all')"
+                conn.execute(sql)
+                self.logger.debug("FTS table deleted")
+
+                # 4.新しいデータを一括挿入（チャンク単位でメモリ使用量を抑える）
+                inserted_count = 0
+                while chunk := list(islice(rows, chunksize)):
+                    cursor = conn.executemany(INSERT_SQL, chunk)
+                    inserted_count += cursor.rowcount
+                self.logger.info(
+                    f"New medicine data inserted: {inserted_count} records"
                 )
 
-            sql = """
-                INSERT INTO medicines (
-                    classification, ingredient_name, specification, medicine_name,
-                    manufacturer, price, medicine_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            cursor = conn.executemany(sql, insert_data)
-            inserted_count = cursor.rowcount
-            self.logger.info(f"New medicine data inserted: {inserted_count} records")
+                # 5.インデックスを再構築
+                conn.execute(INGREDIENT_INDEX_SQL)
+                self.logger.debug("Ingredient index rebuilt")
 
-            # 4.FTSインデックス再構築
-            sql = "INSERT INTO medicines_fts(medicines_fts) VALUES('rebuild')"
-            conn.execute(sql)
-            self.logger.debug("FTS index rebuilt")
+                # 6.挿入したデータでFTSインデックスを構築（rebuildによる再走査を省略）
+                conn.execute(FTS_POPULATE_SQL)
+                self.logger.debug("FTS index populated")
 
-            conn.commit()
+                conn.execute("COMMIT")
+
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            finally:
+                self._stats_cache = None
+                self._search_cache.clear()
 
         self.logger.info(
             f"Full medicine replacement completed: {inserted_count} records"
@@ -242,51 +555,77 @@ class DatabaseManager:
 
         return inserted_count
 
+    @staticmethod
+    def _iter_medicine_rows(medicines: Iterable[dict]) -> Iterator[tuple]:
+        """薬剤データをMEDICINE_COLUMNSの列順のタプルとして順次生成"""
+        for medicine in medicines:
+            yield tuple(medicine.get(column) for column in MEDICINE_COLUMNS)
+
     def get_statistics(self) -> dict:
         """
         DB統計情報を取得
 
+        薬剤マスタの更新時以外は変化しないため結果をキャッシュする
+        （他プロセスによる更新はPRAGMA data_versionの変化で検知）
+
         Returns:
             統計情報辞書
         """
         with self.get_connection() as conn:
-            stats = {}
-
-            # 総薬剤数
-            sql = "SELECT COUNT(*) FROM medicines"
-            cursor = conn.execute(sql)
-            stats["total_medicines"] = cursor.fetchone()[0]
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._stats_cache and self._stats_cache[0] == data_version:
+                return self._stats_cache[1]
 
-            # 成分数
-            sql = "SELECT COUNT(DISTINCT ingredient_name) FROM medicines"
-            cursor = conn.execute(sql)
-            stats["total_ingredients"] = cursor.fetchone()[0]
+            stats = {}
 
-            # 区分別内訳
+            # 総薬剤数・成分数（1回の走査で集計）
             sql = """
-                SELECT classification, COUNT(*)
+                SELECT COUNT(*), COUNT(DISTINCT ingredient_name)
                 FROM medicines
-                GROUP BY classification
-                ORDER BY COUNT(*) DESC
             """
             cursor = conn.execute(sql)
-            stats["classification_breakdown"] = {
-                row[0]: row[1] for row in cursor.fetchall()
-            }
+            stats["total_medicines"], stats["total_ingredients"] = cursor.fetchone()
 
-            # 薬剤タイプ別内訳
+            # 区分別・薬剤タイプ別内訳（UNION ALLで1回のクエリにまとめる）
             sql = """
-                SELECT medicine_type, COUNT(*)
+                SELECT 'classification_breakdown', classification, COUNT(*) AS cnt
+                FROM medicines
+                GROUP BY classification
+                UNION ALL
+                SELECT 'medicine_type_breakdown', medicine_type, COUNT(*) AS cnt
                 FROM medicines
                 GROUP BY medicine_type
-                ORDER BY COUNT(*) DESC
+                ORDER BY 1, cnt DESC
             """
-            cursor = conn.execute(sql)
-            stats["medicine_type_breakdown"] = {
-                row[0]: row[1] for row in cursor.fetchall()
-            }
+            stats["classification_breakdown"] = {}
+            stats["medicine_type_breakdown"] = {}
+            for breakdown, key, count in conn.execute(sql):
+                stats[breakdown][key] = count
 
             # DBサイズ
             stats["db_size"] = self.db_path.stat().st_size
 
+        self._stats_cache = (data_version, stats)
         return stats
+
+
+# アプリ全体で共有するDatabaseManager（デフォルトDB用）
+_shared_db_manager: DatabaseManager | None = None
+_shared_db_manager_lock = threading.Lock()
+
+
+def get_db_manager() -> DatabaseManager:
+    """
+    デフォルトDBの共有DatabaseManagerを取得
+
+    初回呼び出し時に生成し、以降は同じインスタンス（同じ接続）を返す
+
+    Returns:
+        共有DatabaseManager
+    """
+    global _shared_db_manager
+
+    with _shared_db_manager_lock:
+        if _shared_db_manager is None:
+            _shared_db_manager = DatabaseManager()
+        return _shared_db_manager
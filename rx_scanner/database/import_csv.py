@@ -5,18 +5,28 @@ medicine_list_XXXXXXXX.csvを読み込み、薬剤マスタDBに登録する
 
 import argparse
 import logging
+import re
 import sys
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
 
-from rx_scanner.database.db_manager import DatabaseManager
+from rx_scanner.database.db_manager import MEDICINE_COLUMNS, DatabaseManager
+
+# 価格文字列から除去する文字（カンマ・タブや全角スペースを含む空白）
+PRICE_STRIP_PATTERN = re.compile(r"[,\s]")
 
 
 class CSVImporter:
     """CSV薬剤データインポートクラス"""
 
+    # 欠損値のデフォルト値（記載のない列は空文字）
+    COLUMN_DEFAULTS = {
+        "classification": "未分類",
+        "manufacturer": "不明",
+        "medicine_type": "その他",
+    }
+
     def __init__(self, db_manager: DatabaseManager | None = None):
         """
         Args:
@@ -36,6 +46,22 @@ class CSVImporter:
         Returns:
             薬剤データのリスト
 
+        Raises:
+            FileNotFoundError: ファイルが見つからない場合
+            ValueError: データ形式が不正な場合
+        """
+        return self._read_csv_frame(csv_path).to_dict(orient="records")
+
+    def _read_csv_frame(self, csv_path: str | Path) -> pd.DataFrame:
+        """
+        CSVファイルを読み込み、整形済みのDataFrameを返す
+
+        Args:
+            csv_path: CSVファイルのパス
+
+        Returns:
+            MEDICINE_COLUMNSの列順に整形した薬剤データ
+
         Raises:
             FileNotFoundError: ファイルが見つからない場合
             ValueError: データ形式が不正な場合
@@ -45,57 +71,41 @@ class CSVImporter:
             raise FileNotFoundError(f"CSVファイルが見つかりません: {csv_path}")
 
         try:
-            # CSVファイルを読み込み
-            df = pd.read_csv(csv_path)
+            # CSVファイルを読み込み（型推論を行わず全列を文字列として読み込む）
+            df = pd.read_csv(csv_path, dtype="string")
             self.logger.info(f"CSV file loaded: {len(df)} rows")
 
-            # 必要な列が存在するかチェック
-            required_columns = [
-                "classification",
-                "ingredient_name",
-                "specification",
-                "medicine_name",
-                "manufacturer",
-                "price",
-                "medicine_type",
-            ]
+            # 必要な列が存在するかチェック（列順はDBへの挿入順に合わせる）
+            required_columns = list(MEDICINE_COLUMNS)
 
             missing_columns = [col for col in required_columns if col not in df.columns]
             if missing_columns:
                 raise ValueError(f"必要な列が不足しています: {missing_columns}")
 
-            # データを辞書のリストに変換
-            medicines = []
-            for _, row in df.iterrows():
-                # 空行をスキップ
-                if (
-                    pd.isna(row["medicine_name"])
-                    or not str(row["medicine_name"]).strip()
-                ):
-                    self.logger.warning(f"Skipping row with empty medicine name: {row}")
-                    continue
-
-                medicine = {
-                    "classification": str(row["classification"]).strip()
-                    if pd.notna(row["classification"])
-                    else "未分類",
-                    "ingredient_name": str(row["ingredient_name"]).strip()
-                    if pd.notna(row["ingredient_name"])
-                    else "",
-                    "specification": str(row["specification"]).strip()
-                    if pd.notna(row["specification"])
-                    else "",
-                    "medicine_name": str(row["medicine_name"]).strip(),
-                    "manufacturer": str(row["manufacturer"]).strip()
-                    if pd.notna(row["manufacturer"])
-                    else "不明",
-                    "price": self._parse_price(row["price"]),
-                    "medicine_type": str(row["medicine_type"]).strip()
-                    if pd.notna(row["medicine_type"])
-                    else "その他",
-                }
-
-                medicines.append(medicine)
+            df = df[required_columns]
+
+            # 空行（薬剤名が空）をスキップ
+            medicine_names = df["medicine_name"].str.strip()
+            empty_mask = medicine_names.fillna("").eq("")
+            if empty_mask.any():
+                self.logger.warning(
+                    f"Skipping {int(empty_mask.sum())} rows with empty medicine name"
+                )
+            df = df[~empty_mask]
+
+            # 列単位で文字列を整形（欠損値はデフォルト値で補完）
+            columns = {}
+            for column in required_columns:
+                if column == "price":
+                    columns[column] = self._parse_price_column(df[column])
+                else:
+                    columns[column] = (
+                        df[column]
+                        .str.strip()
+                        .fillna(self.COLUMN_DEFAULTS.get(column, ""))
+                    )
+
+            medicines = pd.DataFrame(columns)
 
             self.logger.info(f"Valid medicine data: {len(medicines)} records")
             return medicines
@@ -116,15 +126,17 @@ class CSVImporter:
         """
         try:
             # CSVデータを読み込み
-            medicines = self.read_csv_data(csv_path)
+            medicines = self._read_csv_frame(csv_path)
 
-            if not medicines:
+            if medicines.empty:
                 self.logger.warning("No data to import")
                 return 0
 
-            # DBに全薬剤を置き換えてインポート
+            # DBに全薬剤を置き換えてインポート（辞書を経由せず行タプルを直接渡す）
             self.logger.info("Starting full medicine replacement import")
-            count = self.db_manager.replace_all_medicines(medicines)
+            count = self.db_manager.replace_all_medicines_iter(
+                medicines.itertuples(index=False, name=None)
+            )
 
             self.logger.info(f"Import completed: {count} records")
             return count
@@ -145,8 +157,9 @@ class CSVImporter:
             プレビューデータのリスト
         """
         try:
-            medicines = self.read_csv_data(csv_path)
-            preview_data = medicines[:limit]
+            # 表示する先頭行のみ辞書に変換
+            medicines = self._read_csv_frame(csv_path)
+            preview_data = medicines.head(limit).to_dict(orient="records")
 
             self.logger.info(
                 f"Preview displayed: {len(preview_data)} records "
@@ -158,28 +171,29 @@ class CSVImporter:
             self.logger.error(f"Preview error: {e}")
             return []
 
-    def _parse_price(self, price_data: Any) -> float:
+    def _parse_price_column(self, prices: pd.Series) -> pd.Series:
         """
-        価格文字列をfloatに変換（カンマ区切りや空白を除去）
+        価格列をまとめてfloatに変換（カンマ区切りや空白を除去）
         - エクセルの書式設定に由来する不整合データ
 
         Args:
-            price_data: 価格データ（str, float, int, Noneなど）
+            prices: 価格列
 
         Returns:
-            float値の価格
+            float64の価格列（変換できない値は0.0）
         """
-        if pd.isna(price_data) or str(price_data).strip() == "":
-            return 0.0
-
-        try:
-            # 文字列に変換してカンマと空白を除去
-            clean_price = str(price_data).strip().replace(",", "").replace(" ", "")
-            return float(clean_price)
+        # _read_csv_frameで文字列型として読み込み済み
+        # 区切り文字と空白（前後・途中とも）を1回の置換でまとめて除去
+        cleaned = prices.str.replace(PRICE_STRIP_PATTERN, "", regex=True)
+        parsed = pd.to_numeric(cleaned, errors="coerce")
+
+        invalid_mask = parsed.isna() & cleaned.fillna("").ne("")
+        if invalid_mask.any():
+            self.logger.warning(
+                f"Price conversion error: {int(invalid_mask.sum())} values -> 0.0"
+            )
 
-        except (ValueError, TypeError):
-            self.logger.warning(f"Price conversion error: {price_data} -> 0.0")
-            return 0.0
+        return parsed.fillna(0.0).astype("float64")
 
 
 def main():
@@ -1,12 +1,13 @@
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 
-from rx_scanner.ui.main_window import MainWindow
-
 
 def setup_logging():
     """ログ設定（ファイル + 標準出力）"""
@@ -21,9 +22,10 @@ def setup_logging():
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "app.log"
 
-    # ログフォーマット
+    # ログフォーマット（両ハンドラーで同じFormatterを共有）
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
+    formatter = logging.Formatter(log_format, datefmt=date_format)
 
     # ルートロガー取得
     root_logger = logging.getLogger()
@@ -32,26 +34,38 @@ def setup_logging():
     # 既存のハンドラーをクリア
     root_logger.handlers.clear()
 
-    # ファイルハンドラー（ローテーション: 5MB x 3ファイル）
+    # ファイルハンドラー（ローテーション: 10MB x 3ファイル）
     file_handler = RotatingFileHandler(
-        log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+    file_handler.setFormatter(formatter)
 
     # コンソールハンドラー
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+    console_handler.setFormatter(formatter)
+
+    # ハンドラー追加（GUIスレッドではキューに積むのみ、出力は別スレッドで実行）
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
 
-    # ハンドラー追加
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # 終了時はキューを処理しきってから停止（logging.shutdownより先に実行される）
+    atexit.register(listener.stop)
 
     root_logger.info(f"log_file: {log_file}")
 
 
 def main():
+    # Tesseractは内部のOpenMP並列よりプロセス単位の並列の方が速いため1スレッドに制限
+    # 起動するTesseractに継承される（スレッド生成前に1回だけ設定、明示的な指定は優先）
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
     setup_logging()
 
     app = QApplication(sys.argv)
@@ -59,6 +73,9 @@ def main():
     app.setApplicationVersion("0.1.0")
     app.setOrganizationName("CuriFun")
 
+    # OpenCV・Tesseract・DBを読み込むUIモジュールはQApplication生成後にインポート
+    from rx_scanner.ui.main_window import MainWindow
+
     window = MainWindow()
     window.show()
 
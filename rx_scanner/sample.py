@@ -1,4 +1,5 @@
 import logging
+from functools import cache
 
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QFont, Qt
@@ -16,10 +17,16 @@ from PySide6.QtWidgets import (
 from rx_scanner.database.db_manager import DatabaseManager
 
 
+@cache
+def _search_input_font() -> QFont:
+    """検索入力欄のフォント（初回のみ生成して使い回す）"""
+    return QFont("", 12)
+
+
 class SearchTab(QWidget):
     def __init__(self):
         super().__init__()
-        self.logegr = logging.getLogger(__name__)
+        self.logger = logging.getLogger(__name__)
 
         self.selected_medicine = None
 
@@ -62,7 +69,7 @@ class SearchTab(QWidget):
 
         search_input = QLineEdit()
         search_input.setPlaceholderText("薬剤名を入力してください")
-        search_input.setFont(QFont(""), 12)
+        search_input.setFont(_search_input_font())
 
         self.search_button = QPushButton("検索")
         self.search_button.setMinimumWidth(80)
@@ -21,6 +21,9 @@ from .search_tab import SearchTab
 class MainWindow(QMainWindow):
     """アプリケーションのメインウィンドウ"""
 
+    # タブ切り替え時のステータスバー表示（タブの並び順）
+    TAB_MESSAGES = ("処方箋OCRタブ", "薬剤検索タブ")
+
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -29,7 +32,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """ウィンドウを閉じる時の処理"""
-        # 保存されていない薬剤リストがあるかチェック
+        # 保存されていない薬剤リストがあるかチェック（空の場合は確認なしで終了）
         if self.prescription_tab.confirmed_list.count() > 0:
             reply = QMessageBox.question(
                 self,
@@ -41,13 +44,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.No,
             )
 
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            # 薬剤リストが空の場合は確認なしで終了
-            event.accept()
+                return
+
+        # OCRワーカースレッドを停止してから終了
+        self.prescription_tab.shutdown()
+        event.accept()
 
     def init_ui(self):
         """UI初期化（ウィンドウ設定、タブ作成）"""
@@ -62,10 +65,12 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
 
         self.prescription_tab = PrescriptionTab()
-        self.search_tab = SearchTab()
+
+        # 薬剤検索タブは初回表示時に生成（それまではプレースホルダーを配置）
+        self.search_tab: SearchTab | None = None
 
         self.tab_widget.addTab(self.prescription_tab, "Prescription")
-        self.tab_widget.addTab(self.search_tab, "Search")
+        self.tab_widget.addTab(QWidget(), "Search")
         layout.addWidget(self.tab_widget)
 
         # タブ切り替え時のシグナル接続
@@ -107,10 +112,27 @@ class MainWindow(QMainWindow):
 
     def on_tab_changed(self, index):
         """タブ切り替え時の処理"""
-        if index == 0:
-            self.statusbar.showMessage("処方箋OCRタブ")
-        elif index == 1:
-            self.statusbar.showMessage("薬剤検索タブ")
+        # 薬剤検索タブは初回表示時に生成
+        if index == 1 and self.search_tab is None:
+            self._build_search_tab()
+
+        if 0 <= index < len(self.TAB_MESSAGES):
+            self.statusbar.showMessage(self.TAB_MESSAGES[index])
+
+    def _build_search_tab(self):
+        """薬剤検索タブを生成してプレースホルダーと差し替え"""
+        self.search_tab = SearchTab()
+
+        # 差し替え中のタブ切り替えシグナルは無視
+        self.tab_widget.blockSignals(True)
+        try:
+            placeholder = self.tab_widget.widget(1)
+            self.tab_widget.removeTab(1)
+            self.tab_widget.insertTab(1, self.search_tab, "Search")
+            self.tab_widget.setCurrentIndex(1)
+            placeholder.deleteLater()
+        finally:
+            self.tab_widget.blockSignals(False)
 
     def on_show_about(self):
         """バージョン情報表示"""
@@ -3,7 +3,10 @@
 先発・後発品の選択と価格比較機能
 """
 
-from PySide6.QtCore import Qt
+from operator import itemgetter
+
+from PySide6.QtCore import QAbstractTableModel, Qt
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QDialog,
@@ -13,12 +16,96 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
 
+class MedicineTableModel(QAbstractTableModel):
+    """
+    薬剤選択テーブルのモデル
+
+    セルのオブジェクトを事前に生成せず、表示中のセルの値のみ都度返す
+    """
+
+    # 列見出し
+    HEADERS = ("薬剤名", "分類", "価格", "メーカー")
+
+    # 価格の表示形式
+    PRICE_FORMAT = "¥{:.2f}"
+
+    # 元薬剤（先頭行）の薬剤名の背景色
+    ORIGINAL_BACKGROUND = QColor(Qt.GlobalColor.cyan)
+
+    # 分類ごとの背景色
+    TYPE_BACKGROUNDS = {
+        "先発品": QColor(Qt.GlobalColor.yellow),
+        "後発品": QColor(Qt.GlobalColor.green),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._medicines: list[dict] = []
+
+    def set_medicines(self, medicines: list[dict]):
+        """
+        表示する薬剤データを設定
+
+        Args:
+            medicines: 薬剤データのリスト（先頭は元薬剤）
+        """
+        self.beginResetModel()
+        self._medicines = medicines
+        self.endResetModel()
+
+    def medicine(self, row: int) -> dict:
+        """指定行の薬剤データを取得"""
+        return self._medicines[row]
+
+    def rowCount(self, parent=None):
+        # 表形式のため子要素を持たない
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._medicines)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        medicine = self._medicines[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return medicine["medicine_name"]
+            if column == 1:
+                return medicine["medicine_type"]
+            if column == 2:
+                return self.PRICE_FORMAT.format(medicine["price"])
+            return medicine["manufacturer"]
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if column == 0 and index.row() == 0:
+                return self.ORIGINAL_BACKGROUND
+            if column == 1:
+                return self.TYPE_BACKGROUNDS.get(medicine["medicine_type"])
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class MedicineSelectionDialog(QDialog):
     """薬剤選択ダイアログ（先発・後発品選択）"""
 
@@ -63,10 +150,9 @@ class MedicineSelectionDialog(QDialog):
         group_layout = QVBoxLayout(original_group)
 
         # display_nameがあればそれを使用
-        medicine_name = (
-            self.medicine_data.get("display_name")
-            or self.medicine_data["medicine_name"]
-        )
+        medicine_name = self.medicine_data.get(
+            "display_name"
+        ) or self.medicine_data.get("medicine_name", "")
 
         original_info = QLabel(f"薬剤名: {medicine_name}")
         original_info.setStyleSheet(
@@ -80,11 +166,9 @@ class MedicineSelectionDialog(QDialog):
         table_group = QGroupBox("選択可能な薬剤（価格順）")
         group_layout = QVBoxLayout(table_group)
 
-        self.medicine_table = QTableWidget()
-        self.medicine_table.setColumnCount(4)
-        self.medicine_table.setHorizontalHeaderLabels(
-            ["薬剤名", "分類", "価格", "メーカー"]
-        )
+        self.medicine_model = MedicineTableModel(self)
+        self.medicine_table = QTableView()
+        self.medicine_table.setModel(self.medicine_model)
 
         # テーブル設定
         header = self.medicine_table.horizontalHeader()
@@ -107,7 +191,9 @@ class MedicineSelectionDialog(QDialog):
         parent.addWidget(table_group)
 
         # シグナル接続
-        self.medicine_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.medicine_table.selectionModel().selectionChanged.connect(
+            self.on_selection_changed
+        )
 
     def setup_selection_info_area(self, parent):
         """選択情報エリア設定"""
@@ -137,26 +223,25 @@ class MedicineSelectionDialog(QDialog):
 
     def on_selection_changed(self):
         """選択変更イベント"""
-        row = self.medicine_table.currentRow()
-        if row < 0:
+        selected_rows = self.medicine_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.select_button.setEnabled(False)
             self.selection_info.setText("薬剤を選択してください")
             return
 
         # 選択された行の薬剤データを取得
-        name_item = self.medicine_table.item(row, 0)
-        selected_medicine = name_item.data(Qt.ItemDataRole.UserRole)
+        selected_medicine = self.medicine_model.medicine(selected_rows[0].row())
 
         if selected_medicine:
             # 選択情報を表示
             medicine_name = selected_medicine["medicine_name"]
             medicine_type = selected_medicine["medicine_type"]
-            price = selected_medicine["price"]
+            price = MedicineTableModel.PRICE_FORMAT.format(selected_medicine["price"])
             manufacturer = selected_medicine["manufacturer"]
 
             info_text = (
                 f"選択中: {medicine_name}\n"
-                f"分類: {medicine_type} | 価格: ¥{price:.2f} | メーカー: {manufacturer}"
+                f"分類: {medicine_type} | 価格: {price} | メーカー: {manufacturer}"
             )
             self.selection_info.setText(info_text)
             self.select_button.setEnabled(True)
@@ -191,35 +276,11 @@ class MedicineSelectionDialog(QDialog):
             self.selection_info.setText("この薬剤には代替薬剤がありません")
             return
 
-        # 元薬剤 + 関連薬剤をすべて表示
-        all_medicines = [self.medicine_data] + alternatives
-
-        self.medicine_table.setRowCount(len(all_medicines))
-
-        for row, medicine in enumerate(all_medicines):
-            # 薬剤名
-            name_item = QTableWidgetItem(medicine["medicine_name"])
-            if row == 0:  # 元薬剤
-                name_item.setBackground(Qt.GlobalColor.cyan)
-            self.medicine_table.setItem(row, 0, name_item)
-
-            # 分類
-            medicine_type = medicine["medicine_type"]
-            type_item = QTableWidgetItem(medicine_type)
-            if medicine_type == "先発品":
-                type_item.setBackground(Qt.GlobalColor.yellow)
-            elif medicine_type == "後発品":
-                type_item.setBackground(Qt.GlobalColor.green)
-            self.medicine_table.setItem(row, 1, type_item)
-
-            # 価格
-            price = medicine["price"]
-            price_item = QTableWidgetItem(f"¥{price:.2f}")
-            self.medicine_table.setItem(row, 2, price_item)
-
-            # メーカー
-            manufacturer_item = QTableWidgetItem(medicine["manufacturer"])
-            self.medicine_table.setItem(row, 3, manufacturer_item)
-
-            # 薬剤データを行に関連付け
-            name_item.setData(Qt.ItemDataRole.UserRole, medicine)
+        # 元薬剤 + 関連薬剤（価格の昇順）をすべて表示
+        # 表示上の価格は文字列のため、ここで数値として並べ替え
+        all_medicines = [self.medicine_data] + sorted(
+            alternatives, key=itemgetter("price")
+        )
+
+        # セルはビューが表示時にモデルから取得する
+        self.medicine_model.set_medicines(all_medicines)
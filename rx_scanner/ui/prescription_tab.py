@@ -7,12 +7,22 @@
 
 import csv
 import logging
-import os
-import re
+import queue
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSize,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QFileDialog,
     QGroupBox,
@@ -33,27 +43,72 @@ from rx_scanner.ui.medicine_selection_dialog import MedicineSelectionDialog
 from rx_scanner.utils.ocr_processor import OCRProcessor
 
 
+@lru_cache(maxsize=512)
+def _format_confirmed_text(medicine_name, medicine_type, price):
+    """
+    確定リストの表示テキストを作成（同じ薬剤の再追加時はキャッシュを利用）
+
+    Args:
+        medicine_name: 薬剤名
+        medicine_type: 分類（空の場合は省略）
+        price: 薬価（0の場合は省略）
+
+    Returns:
+        "薬剤名 [分類] (¥薬価)"形式のテキスト
+    """
+    display_text = f"{medicine_name}"
+    if medicine_type:
+        display_text += f" [{medicine_type}]"
+    if price:
+        display_text += f" (¥{price:.2f})"
+    return display_text
+
+
 class OCRWorker(QThread):
-    """OCR処理用ワーカースレッド"""
+    """
+    OCR処理用ワーカースレッド
+
+    常駐して画像パスのキューを順に処理する（OCRProcessorは1回だけ生成して使い回す）
+    """
 
     finished = Signal(dict)  # OCR結果（抽出されたテキストと薬剤情報）
     error = Signal(str)  # エラーメッセージ
 
-    def __init__(self, image_path):
+    def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
 
-        self.image_path = image_path
+        # 処理待ちの画像パス（Noneは停止指示）
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+
+        # OCRProcessorはワーカースレッド上で初回処理時に生成
+        self._ocr_processor: OCRProcessor | None = None
+
+    def enqueue(self, image_path: str):
+        """OCR対象の画像を追加"""
+        self._queue.put(image_path)
+
+    def stop(self):
+        """キューの処理を終えてからスレッドを停止"""
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
 
     def run(self):
+        """キューの画像を順にOCR処理"""
+        while (image_path := self._queue.get()) is not None:
+            self._process_image(image_path)
+
+    def _process_image(self, image_path: str):
         """OCR処理実行"""
         try:
-            ocr_processor = OCRProcessor()
-            result = ocr_processor.process_image(self.image_path)
+            if self._ocr_processor is None:
+                self._ocr_processor = OCRProcessor()
+            result = self._ocr_processor.process_image(image_path)
             self.finished.emit(result)
 
         except FileNotFoundError as e:
-            self.logger.error(f"Image file not found: {self.image_path}")
+            self.logger.error(f"Image file not found: {image_path}")
             self.error.emit(str(e))
 
         except ValueError as e:
@@ -65,28 +120,107 @@ class OCRWorker(QThread):
             self.error.emit(f"予期しないエラーが発生しました:\n{str(e)}")
 
 
+class ImageLoadSignals(QObject):
+    """画像読み込みタスクの結果通知用シグナル"""
+
+    loaded = Signal(str, QImage)  # 画像パス, 読み込んだ画像（失敗時はnull）
+
+
+class ImageLoadTask(QRunnable):
+    """
+    プレビュー画像の読み込みタスク
+
+    QThreadPool上でデコードし、表示に必要なサイズまで縮小して読み込む
+    """
+
+    def __init__(self, file_path: str, max_size: QSize):
+        super().__init__()
+        self.file_path = file_path
+        self.max_size = max_size
+        self.signals = ImageLoadSignals()
+
+    def run(self):
+        """画像をデコードして結果を通知"""
+        reader = QImageReader(self.file_path)
+        reader.setAutoTransform(True)
+
+        # 表示上限より大きい画像はデコード時に縮小（元画像全体は展開しない）
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > self.max_size.width()
+            or source_size.height() > self.max_size.height()
+        ):
+            reader.setScaledSize(
+                source_size.scaled(self.max_size, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+
+        self.signals.loaded.emit(self.file_path, reader.read())
+
+
 class PrescriptionTab(QWidget):
     """処方箋OCRタブクラス"""
 
+    # サポートする画像形式（拡張子）
+    SUPPORTED_FORMATS = (".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif")
+    # リサイズイベントをまとめて再スケールするまでの待ち時間（ミリ秒）
+    RESIZE_DEBOUNCE_MS = 16
+    # リサイズ停止後に高画質で再スケールするまでの待ち時間（ミリ秒）
+    SMOOTH_SCALE_DELAY_MS = 120
+    # プレビュー画像はラベルサイズの何倍まで保持するか（拡大リサイズ用の余裕）
+    PREVIEW_SIZE_FACTOR = 2
+    # プレビュー画像の最低保持サイズ（ラベル表示前の読み込み対策）
+    PREVIEW_MIN_SIZE = QSize(1024, 1024)
+
     def __init__(self):
         super().__init__()
 
         # 画像関連
         self.current_image_path = None
-        self.original_pixmap = None
+        self.original_pixmap = None  # 表示用に縮小して読み込んだ画像
+        # 読み込み中の画像パス（古い読み込み結果を無視するため）
+        self._loading_image_path: str | None = None
+        # 直近のスケール結果（ラベルサイズ, 変換モード, スケール済み画像）
+        self._scaled_cache: tuple[QSize, Qt.TransformationMode, QPixmap] | None = None
+
+        # リサイズ中の連続イベントを1回の再スケールにまとめるタイマー（低画質）
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(
+            lambda: self._update_image_display(Qt.TransformationMode.FastTransformation)
+        )
+        # リサイズが止まったら高画質で再スケールするタイマー
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_SCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._update_image_display)
 
         # OCR結果
         self.raw_ocr_text = None
         self.extracted_medicines = []
 
-        # ワーカースレッド
-        self.ocr_worker = None
+        # 確定リストの表示テキストと件数（重複チェック用）
+        # 重複追加も許可するため件数で管理し、リストの変更シグナルで同期する
+        self._confirmed_texts: Counter[str] = Counter()
+        # 一括照合中は重複確認を出さずに溜めておく（表示テキスト, 薬剤情報）
+        self._suppress_duplicate_prompt = False
+        self._pending_duplicates: list[tuple[str, dict]] = []
+
+        # ワーカースレッド（常駐）
+        self.ocr_worker = OCRWorker()
+        self.ocr_worker.finished.connect(self.on_ocr_finished)
+        self.ocr_worker.error.connect(self.on_ocr_error)
+        self.ocr_worker.start()
 
         # ドラッグ&ドロップ有効化
         self.setAcceptDrops(True)
 
         self.init_ui()
 
+    def shutdown(self):
+        """ワーカースレッドを停止（アプリ終了時）"""
+        self.ocr_worker.stop()
+
     def dragEnterEvent(self, event):
         """ドラッグイベント（ファイルがドラッグされた時）"""
         if event.mimeData().hasUrls():
@@ -105,7 +239,8 @@ class PrescriptionTab(QWidget):
     def resizeEvent(self, event):
         """ウィンドウリサイズ時に画像も再スケール"""
         super().resizeEvent(event)
-        self._update_image_display()
+        self._resize_timer.start()
+        self._smooth_timer.start()
 
     def init_ui(self):
         """UI初期化"""
@@ -177,6 +312,10 @@ class PrescriptionTab(QWidget):
             Qt.ContextMenuPolicy.CustomContextMenu
         )
 
+        # OCR結果リストの右クリックメニュー（使い回す）
+        self.ocr_context_menu = QMenu(self)
+        self.ocr_delete_action = self.ocr_context_menu.addAction("削除")
+
         # 全テキスト表示ボタン
         self.show_full_text_button = QPushButton("全テキストを表示")
         self.show_full_text_button.setEnabled(False)
@@ -228,6 +367,10 @@ class PrescriptionTab(QWidget):
         parent.addWidget(output_group)
 
         # シグナル接続
+        confirmed_model = self.confirmed_list.model()
+        confirmed_model.rowsInserted.connect(self._on_confirmed_rows_inserted)
+        confirmed_model.rowsAboutToBeRemoved.connect(self._on_confirmed_rows_removed)
+        confirmed_model.modelReset.connect(self._confirmed_texts.clear)
         self.remove_button.clicked.connect(self.on_remove_selected_medicine)
         self.clear_button.clicked.connect(self.on_clear_medicine_list)
         self.export_button.clicked.connect(self.on_export_csv)
@@ -254,11 +397,8 @@ class PrescriptionTab(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
 
-        # OCRワーカー起動
-        self.ocr_worker = OCRWorker(self.current_image_path)
-        self.ocr_worker.finished.connect(self.on_ocr_finished)
-        self.ocr_worker.error.connect(self.on_ocr_error)
-        self.ocr_worker.start()
+        # OCRワーカーに処理を依頼
+        self.ocr_worker.enqueue(self.current_image_path)
 
     def on_ocr_finished(self, result):
         """OCR処理完了時"""
@@ -268,15 +408,19 @@ class PrescriptionTab(QWidget):
         # 全テキストを保存
         self.raw_ocr_text = result.get("raw_text", "")
 
-        # OCR結果をリストに表示
-        self.ocr_results_list.clear()
-        for medicine_data in self.extracted_medicines:
-            # display_nameがあればそれを使用（部分一致の場合は成分名）
-            medicine_name = (
-                medicine_data.get("display_name") or medicine_data["medicine_name"]
+        # OCR結果をリストに表示（再描画は入れ替え後の1回のみ）
+        # display_nameがあればそれを使用（部分一致の場合は成分名）
+        self.ocr_results_list.setUpdatesEnabled(False)
+        try:
+            self.ocr_results_list.clear()
+            self.ocr_results_list.addItems(
+                [
+                    medicine_data.get("display_name") or medicine_data["medicine_name"]
+                    for medicine_data in self.extracted_medicines
+                ]
             )
-            item = QListWidgetItem(medicine_name)
-            self.ocr_results_list.addItem(item)
+        finally:
+            self.ocr_results_list.setUpdatesEnabled(True)
 
         # ボタンを有効化
         self.show_full_text_button.setEnabled(True)
@@ -317,21 +461,33 @@ class PrescriptionTab(QWidget):
             QMessageBox.warning(self, "警告", "薬剤名がありません。")
             return
 
+        # 選択ダイアログが不要なら確定リストの再描画を追加後の1回にまとめる
+        # （ダイアログ表示中は背後のリストを最新に保つため抑止しない）
+        needs_dialog = any(
+            medicine_data.get("has_alternatives")
+            for medicine_data in self.extracted_medicines
+        )
+        if not needs_dialog:
+            self.confirmed_list.setUpdatesEnabled(False)
+
+        # 照合中の重複は個別に確認せず、最後にまとめて確認する
+        self._suppress_duplicate_prompt = True
+        self._pending_duplicates = []
+
         try:
             # 各抽出薬剤について処理
             for medicine_data in self.extracted_medicines:
-                has_alternatives = medicine_data.get("has_alternatives", False)
-
-                if has_alternatives:
-                    # 代替薬剤がある場合は選択ダイアログを表示
-                    dialog = MedicineSelectionDialog(medicine_data, self)
-                    if dialog.exec() == dialog.DialogCode.Accepted:
-                        selected_medicine = dialog.selected_medicine
-                        self._add_medicine_to_confirmed_list(selected_medicine)
-                    # キャンセルされた場合は何もしない
-                else:
+                if not medicine_data.get("has_alternatives", False):
                     # 代替薬剤がない場合は直接追加
                     self._add_medicine_to_confirmed_list(medicine_data)
+                    continue
+
+                # 代替薬剤がある場合は選択ダイアログを表示
+                dialog = MedicineSelectionDialog(medicine_data, self)
+                if dialog.exec() == dialog.DialogCode.Accepted:
+                    selected_medicine = dialog.selected_medicine
+                    self._add_medicine_to_confirmed_list(selected_medicine)
+                # キャンセルされた場合は何もしない
 
             self.window().statusbar.showMessage("薬剤照合完了")
 
@@ -339,6 +495,36 @@ class PrescriptionTab(QWidget):
             QMessageBox.critical(
                 self, "エラー", f"薬剤照合中にエラーが発生しました:\n{str(e)}"
             )
+        finally:
+            self._suppress_duplicate_prompt = False
+            self.confirmed_list.setUpdatesEnabled(True)
+
+        if self._pending_duplicates:
+            self._confirm_pending_duplicates()
+
+    def _confirm_pending_duplicates(self):
+        """照合中にスキップした重複薬剤をまとめて確認し、追加する"""
+        pending_duplicates = self._pending_duplicates
+        self._pending_duplicates = []
+
+        message_box = QMessageBox(self)
+        message_box.setIcon(QMessageBox.Icon.Question)
+        message_box.setWindowTitle("重複確認")
+        message_box.setText(
+            f"{len(pending_duplicates)}件の薬剤は既にリストに存在するため"
+            "スキップしました。\n\n追加しますか？"
+        )
+        message_box.setDetailedText(
+            "\n".join(display_text for display_text, _ in pending_duplicates)
+        )
+        message_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        message_box.setDefaultButton(QMessageBox.StandardButton.No)
+
+        if message_box.exec() == QMessageBox.StandardButton.Yes:
+            for display_text, medicine_data in pending_duplicates:
+                self.add_confirmed_item(f"✓ {display_text}", medicine_data)
 
     def on_show_medicine_context_menu(self, position):
         """OCR結果リストの右クリックメニューを表示"""
@@ -348,15 +534,11 @@ class PrescriptionTab(QWidget):
         if not current_item:
             return
 
-        # メニュー作成
-        menu = QMenu()
-        delete_action = menu.addAction("削除")
-
         # メニューを表示してアクションを取得
-        action = menu.exec(self.ocr_results_list.mapToGlobal(position))
+        action = self.ocr_context_menu.exec(self.ocr_results_list.mapToGlobal(position))
 
         # 削除処理
-        if action == delete_action:
+        if action == self.ocr_delete_action:
             row = self.ocr_results_list.row(current_item)
             self.ocr_results_list.takeItem(row)
             # extracted_medicinesリストからも削除
@@ -385,40 +567,28 @@ class PrescriptionTab(QWidget):
 
         if file_path:
             try:
-                with open(file_path, "w", encoding="utf-8", newline="") as f:
+                # 確定リストの各行に保持した（薬剤名, 分類, 薬価）を出力
+                # 用法・用量・日数・備考は空欄（今後の拡張用）
+                # 行データはQt経由でlistとして返る場合もあるため展開して連結
+                confirmed_list = self.confirmed_list
+                empty_columns = ("", "", "", "")
+                rows = (
+                    (
+                        *confirmed_list.item(i).data(Qt.ItemDataRole.UserRole),
+                        *empty_columns,
+                    )
+                    for i in range(confirmed_list.count())
+                )
+
+                with open(
+                    file_path, "w", encoding="utf-8", newline="", buffering=1 << 16
+                ) as f:
                     writer = csv.writer(f)
                     # ヘッダー行
                     writer.writerow(
                         ["薬剤名", "分類", "薬価", "用法", "用量", "日数", "備考"]
                     )
-
-                    for i in range(self.confirmed_list.count()):
-                        item_text = self.confirmed_list.item(i).text()
-                        item_text = item_text.replace("✓ ", "")
-
-                        # 薬剤名、分類、薬価を抽出
-                        # 形式: "薬剤名 [分類] (¥薬価)"
-                        medicine_type = ""
-                        price = ""
-
-                        # 薬価を抽出・削除
-                        price_match = re.search(r"\(¥([\d.]+)\)", item_text)
-                        if price_match:
-                            price = price_match.group(1)
-                            item_text = re.sub(r"\s*\(¥[\d.]+\)", "", item_text).strip()
-
-                        # 分類を抽出・削除
-                        type_match = re.search(r"\[([^\]]+)\]", item_text)
-                        if type_match:
-                            medicine_type = type_match.group(1)
-                            medicine_name = item_text[: type_match.start()].strip()
-                        else:
-                            medicine_name = item_text
-
-                        # CSV行を書き込み（用法・用量・日数は空欄 - 今後の拡張用）
-                        writer.writerow(
-                            [medicine_name, medicine_type, price, "", "", "", ""]
-                        )
+                    writer.writerows(rows)
 
                 QMessageBox.information(
                     self, "完了", f"CSVファイルを保存しました:\n{file_path}"
@@ -432,9 +602,12 @@ class PrescriptionTab(QWidget):
 
     def _load_image(self, file_path):
         """画像を読み込んで表示"""
+        image_path = Path(file_path)
         try:
-            # 画像ファイル存在チェック
-            if not os.path.exists(file_path):
+            # 画像ファイル存在チェック（サイズもあわせて取得）
+            try:
+                file_stat = image_path.stat()
+            except FileNotFoundError:
                 QMessageBox.warning(
                     self,
                     "ファイルエラー",
@@ -443,7 +616,7 @@ class PrescriptionTab(QWidget):
                 return
 
             # ファイルサイズチェック（10MB以上は警告）
-            file_size = os.path.getsize(file_path) / (1024 * 1024)
+            file_size = file_stat.st_size / (1024 * 1024)
             if file_size > 10:
                 reply = QMessageBox.question(
                     self,
@@ -456,37 +629,24 @@ class PrescriptionTab(QWidget):
                     return
 
             # サポートされる形式チェック
-            supported_formats = [".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"]
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext not in supported_formats:
+            file_ext = image_path.suffix.lower()
+            if file_ext not in self.SUPPORTED_FORMATS:
                 QMessageBox.warning(
                     self,
                     "ファイル形式エラー",
                     f"サポートされていない画像形式です: {file_ext}\n\n"
-                    f"サポート形式: {', '.join(supported_formats)}",
+                    f"サポート形式: {', '.join(self.SUPPORTED_FORMATS)}",
                 )
                 return
 
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                # 元画像を保持
-                self.original_pixmap = pixmap
-                # 画像をラベルサイズに合わせてスケール
-                self._update_image_display()
-                self.current_image_path = file_path
-                self.ocr_button.setEnabled(True)
-
-                # ステータス更新
-                self.window().statusbar.showMessage(
-                    f"画像読み込み完了: {Path(file_path).name}"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "画像読み込みエラー",
-                    "画像ファイルを読み込めませんでした。\n"
-                    "ファイルが破損している可能性があります。",
-                )
+            # デコードはスレッドプールで行い、完了時に_on_image_loadedで表示
+            self._loading_image_path = file_path
+            max_size = (self.image_label.size() * self.PREVIEW_SIZE_FACTOR).expandedTo(
+                self.PREVIEW_MIN_SIZE
+            )
+            task = ImageLoadTask(file_path, max_size)
+            task.signals.loaded.connect(self._on_image_loaded)
+            QThreadPool.globalInstance().start(task)
         except PermissionError:
             QMessageBox.critical(
                 self,
@@ -498,33 +658,70 @@ class PrescriptionTab(QWidget):
                 self, "エラー", f"画像読み込み中にエラーが発生しました:\n{str(e)}"
             )
 
-    def _update_image_display(self):
-        """画像表示を更新"""
+    def _on_image_loaded(self, file_path: str, image: QImage):
+        """画像読み込み完了時の処理"""
+        # 後から別の画像が選択された場合は古い結果を破棄
+        if file_path != self._loading_image_path:
+            return
+        self._loading_image_path = None
+
+        if image.isNull():
+            QMessageBox.warning(
+                self,
+                "画像読み込みエラー",
+                "画像ファイルを読み込めませんでした。\n"
+                "ファイルが破損している可能性があります。",
+            )
+            return
+
+        # 表示用画像を保持（OCRは元ファイルのパスから実行）
+        self.original_pixmap = QPixmap.fromImage(image)
+        self._scaled_cache = None
+        # 画像をラベルサイズに合わせてスケール
+        self._update_image_display()
+        self.current_image_path = file_path
+        self.ocr_button.setEnabled(True)
+
+        # ステータス更新
+        self.window().statusbar.showMessage(f"画像読み込み完了: {Path(file_path).name}")
+
+    def _update_image_display(self, mode=Qt.TransformationMode.SmoothTransformation):
+        """
+        画像表示を更新
+
+        Args:
+            mode: スケール時の変換モード（リサイズ中は低画質で高速に処理）
+        """
         if self.original_pixmap:
+            target = self.image_label.size()
+            # 同じサイズで同等以上の画質の結果があればそのまま使う
+            if self._scaled_cache and self._scaled_cache[0] == target:
+                cached_mode = self._scaled_cache[1]
+                if cached_mode in (mode, Qt.TransformationMode.SmoothTransformation):
+                    return
             scaled_pixmap = self.original_pixmap.scaled(
-                self.image_label.size(),
+                target,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+                mode,
             )
+            self._scaled_cache = (target, mode, scaled_pixmap)
             self.image_label.setPixmap(scaled_pixmap)
 
     def _add_medicine_to_confirmed_list(self, medicine_data):
         """薬剤を確定リストに追加"""
-        medicine_name = medicine_data["medicine_name"]
-        medicine_type = medicine_data["medicine_type"]
-        price = medicine_data["price"]
-
         # 表示用テキスト作成
-        display_text = f"{medicine_name}"
-        if medicine_type:
-            display_text += f" [{medicine_type}]"
-        if price:
-            display_text += f" (¥{price:.2f})"
-
+        display_text = _format_confirmed_text(
+            medicine_data["medicine_name"],
+            medicine_data["medicine_type"],
+            medicine_data["price"],
+        )
         full_text = f"✓ {display_text}"
 
-        # 重複チェック
+        # 重複チェック（一括照合中は確認を後回しにする）
         if self._is_duplicate(full_text):
+            if self._suppress_duplicate_prompt:
+                self._pending_duplicates.append((display_text, medicine_data))
+                return
             reply = QMessageBox.question(
                 self,
                 "重複確認",
@@ -534,11 +731,43 @@ class PrescriptionTab(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        self.confirmed_list.addItem(full_text)
+        self.add_confirmed_item(full_text, medicine_data)
+
+    def add_confirmed_item(self, display_text, medicine_data):
+        """
+        確定リストに1行追加
+
+        CSV出力用に（薬剤名, 分類, 薬価）を行データとして保持する
+
+        Args:
+            display_text: 確定リストの表示テキスト
+            medicine_data: 薬剤情報の辞書
+        """
+        price = medicine_data["price"]
+        item = QListWidgetItem(display_text)
+        item.setData(
+            Qt.ItemDataRole.UserRole,
+            (
+                medicine_data["medicine_name"],
+                medicine_data["medicine_type"] or "",
+                f"{price:.2f}" if price else "",
+            ),
+        )
+        self.confirmed_list.addItem(item)
+
+    def _on_confirmed_rows_inserted(self, parent, first, last):
+        """確定リストへの追加を重複チェック用の件数に反映"""
+        for row in range(first, last + 1):
+            self._confirmed_texts[self.confirmed_list.item(row).text()] += 1
+
+    def _on_confirmed_rows_removed(self, parent, first, last):
+        """確定リストからの削除を重複チェック用の件数に反映"""
+        for row in range(first, last + 1):
+            text = self.confirmed_list.item(row).text()
+            self._confirmed_texts[text] -= 1
+            if self._confirmed_texts[text] <= 0:
+                del self._confirmed_texts[text]
 
     def _is_duplicate(self, medicine_text):
         """確定リスト内の重複チェック"""
-        for i in range(self.confirmed_list.count()):
-            if self.confirmed_list.item(i).text() == medicine_text:
-                return True
-        return False
+        return medicine_text in self._confirmed_texts
@@ -5,16 +5,25 @@
 リアルタイム検索、検索結果表示、詳細情報表示に対応
 """
 
+import html
 import logging
-
-from PySide6.QtCore import Qt, QTimer
+import time
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMessageBox,
     QPushButton,
     QSplitter,
@@ -23,22 +32,307 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from rx_scanner.database.db_manager import DatabaseManager
+from rx_scanner.database.db_manager import get_db_manager
 from rx_scanner.utils.text_utils import normalize_to_katakana
 
+# 薬剤詳細の表示テンプレート（各項目はHTMLエスケープして埋め込む）
+DETAIL_HTML_TEMPLATE = """
+        <h3 style="color: #007ACC;">
+            {medicine_name}
+        </h3>
+        <table style="width: 100%; border-collapse: collapse; margin-top: 20px;">
+            <tr style="background-color: #f5f5f5;">
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                成分名</td>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                {ingredient_name}</td>
+            </tr>
+            <tr>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                規格</td>
+                <td style="padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                {specification}</td>
+            </tr>
+            <tr style="background-color: #f5f5f5;">
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                区分</td>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                {classification}</td>
+            </tr>
+            <tr>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                薬価</td>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                ¥{price}</td>
+            </tr>
+            <tr style="background-color: #f5f5f5;">
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                薬剤分類</td>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                {medicine_type}</td>
+            </tr>
+            <tr>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                ">
+                メーカー</td>
+                <td style="
+                padding: 8px;
+                border: 1px solid #ddd;
+                ">
+                {manufacturer}</td>
+            </tr>
+        </table>
+        <h4 style="color: #333; margin-top: 20px;">基本情報</h4>
+        <p style="line-height: 1.6; color: #555;">
+        この薬剤の詳細な効能・効果、用法・用量、副作用等の情報は、
+        実際の添付文書を確認してください。
+        </p>
+        <p style="font-size: 12px; color: #888; margin-top: 20px;">
+        ※ 本システムの薬剤情報は参考用です。必ず最新の添付文書をご確認ください。
+        </p>
+        """
+
+
+class MedicineListModel(QAbstractListModel):
+    """
+    検索結果リストのモデル
+
+    行ごとのアイテムを事前に生成せず、表示中の行のテキストのみ作成する
+    作成したテキストは再描画のたびに作り直さないよう行ごとに保持する
+    """
+
+    # 価格の表示形式
+    PRICE_FORMAT = "¥{:.2f}"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._medicines: list[dict] = []
+        # 行ごとの表示テキスト（未作成の行はNone）
+        self._display_texts: list[str | None] = []
+
+    def set_medicines(self, medicines: list[dict]):
+        """
+        表示する薬剤データを設定
+
+        Args:
+            medicines: 薬剤データのリスト
+        """
+        self.beginResetModel()
+        self._medicines = medicines
+        self._display_texts = [None] * len(medicines)
+        self.endResetModel()
+
+    def medicine(self, row: int) -> dict:
+        """指定行の薬剤データを取得"""
+        return self._medicines[row]
+
+    def display_text(self, row: int) -> str:
+        """
+        指定行の表示テキストを取得（初回のみ作成）
+
+        Args:
+            row: 行番号
+
+        Returns:
+            "薬剤名 | メーカー | 価格"形式のテキスト
+        """
+        text = self._display_texts[row]
+        if text is None:
+            medicine = self._medicines[row]
+            price = medicine["price"]
+            price_text = self.PRICE_FORMAT.format(price) if price > 0 else "価格未設定"
+            manufacturer_text = medicine["manufacturer"]
+            text = f"{medicine['medicine_name']} | {manufacturer_text} | {price_text}"
+            self._display_texts[row] = text
+        return text
+
+    def rowCount(self, parent=None):
+        # リスト形式のため子要素を持たない
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._medicines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(index.row())
+
+        if role == Qt.ItemDataRole.UserRole:
+            return self._medicines[index.row()]
+
+        return None
+
+
+class SearchSignals(QObject):
+    """検索タスクの結果通知用シグナル"""
+
+    finished = Signal(str, list)  # 入力された検索文字列, 検索結果
+    failed = Signal(str, str)  # 入力された検索文字列, エラーメッセージ
+
+
+class SearchTask(QRunnable):
+    """
+    薬剤検索タスク
+
+    GUIスレッドを止めないよう、QThreadPool上でDB検索を実行する
+    """
+
+    def __init__(self, db_manager, search_text: str, query: str, limit: int):
+        super().__init__()
+        self.db_manager = db_manager
+        self.search_text = search_text
+        self.query = query
+        self.limit = limit
+        self.signals = SearchSignals()
+
+    def run(self):
+        """DB検索を実行して結果を通知"""
+        try:
+            results = self.db_manager.search_medicines(self.query, limit=self.limit)
+        except Exception as e:
+            self.signals.failed.emit(self.search_text, str(e))
+        else:
+            self.signals.finished.emit(self.search_text, results)
+
 
 class SearchTab(QWidget):
     """薬剤検索タブクラス"""
 
+    # 入力が続いている間の検索待ち時間（ミリ秒）
+    SEARCH_DELAY_TYPING_MS = 500
+    # 入力の間隔が空いた後（貼り付け・IME確定など）の検索待ち時間（ミリ秒）
+    SEARCH_DELAY_IDLE_MS = 80
+    # これより短い間隔の入力は連続入力とみなす（秒）
+    FAST_TYPING_INTERVAL = 0.25
+    # 検索結果の件数上限
+    SEARCH_LIMIT = 200
+
+    # DB接続失敗時の検索に使うダミーデータ
+    DUMMY_MEDICINES = (
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アスピリン",
+            "specification": "100mg1錠",
+            "medicine_name": "アスピリン錠100mg",
+            "manufacturer": "バイエル薬剤",
+            "price": 5.90,
+            "medicine_type": "後発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アスピリン",
+            "specification": "81mg1錠",
+            "medicine_name": "アスピリン錠81mg",
+            "manufacturer": "バイエル薬剤",
+            "price": 5.40,
+            "medicine_type": "後発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アスピリン",
+            "specification": "100mg1錠",
+            "medicine_name": "アスピリン腸溶錠100mg",
+            "manufacturer": "武田薬剤",
+            "price": 6.10,
+            "medicine_type": "先発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "ロキソプロフェンナトリウム水和物",
+            "specification": "60mg1錠",
+            "medicine_name": "ロキソプロフェン錠60mg",
+            "manufacturer": "第一三共",
+            "price": 9.60,
+            "medicine_type": "後発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "ロキソプロフェンナトリウム水和物",
+            "specification": "60mg1錠",
+            "medicine_name": "ロキソニン錠60mg",
+            "manufacturer": "第一三共",
+            "price": 22.10,
+            "medicine_type": "先発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アセトアミノフェン",
+            "specification": "200mg1錠",
+            "medicine_name": "カロナール錠200mg",
+            "manufacturer": "あゆみ製薬",
+            "price": 5.70,
+            "medicine_type": "先発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アセトアミノフェン",
+            "specification": "300mg1錠",
+            "medicine_name": "カロナール錠300mg",
+            "manufacturer": "あゆみ製薬",
+            "price": 6.20,
+            "medicine_type": "先発品",
+        },
+        {
+            "classification": "内用薬",
+            "ingredient_name": "アセトアミノフェン",
+            "specification": "300mg1錠",
+            "medicine_name": "タイレノールA",
+            "manufacturer": "東亜薬剤",
+            "price": 15.80,
+            "medicine_type": "その他",
+        },
+    )
+
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
 
         self.selected_medicine = None
+        # 詳細欄に表示中のHTML（同じ薬剤の再選択時は描画し直さない）
+        self._detail_html: str | None = None
 
         # DB接続
         try:
-            self.db_manager = DatabaseManager()
+            self.db_manager = get_db_manager()
 
         except Exception as e:
             self.db_manager = None
@@ -48,6 +342,17 @@ class SearchTab(QWidget):
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.on_perform_search)
+        # 直前の入力時刻（入力間隔から検索待ち時間を決める）
+        self._last_keystroke_time = 0.0
+
+        # DB検索用スレッドプール（1本で順に処理し、未着手の古い検索は破棄する）
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        # 結果待ちの検索文字列（これと異なる検索の結果は古いものとして無視）
+        self._pending_search: str | None = None
+        # 直近に表示したDB検索のクエリ（カタカナ変換後）と結果（絞り込み検索用）
+        self._last_query: str | None = None
+        self._last_results: list[dict] = []
 
         self.init_ui()
 
@@ -128,9 +433,13 @@ class SearchTab(QWidget):
         self.result_count_label = QLabel("0件")
 
         # 検索結果リスト
-        self.results_list = QListWidget()
+        self.results_model = MedicineListModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
         self.results_list.setMinimumWidth(300)
         self.results_list.setAlternatingRowColors(True)
+        # 全行同じ高さのため行ごとのサイズ計算を省略
+        self.results_list.setUniformItemSizes(True)
 
         group_layout.addWidget(self.result_count_label)
         group_layout.addWidget(self.results_list)
@@ -138,7 +447,7 @@ class SearchTab(QWidget):
         parent.addWidget(results_group)
 
         # シグナル接続
-        self.results_list.itemClicked.connect(self.on_medicine_selected)
+        self.results_list.clicked.connect(self.on_medicine_selected)
 
     def setup_detail_area(self, parent):
         """薬剤詳細情報と操作ボタンのUI構築"""
@@ -177,15 +486,25 @@ class SearchTab(QWidget):
 
     def on_search_text_changed(self, text):
         """検索テキスト変更イベント（デバウンス処理）"""
+        now = time.monotonic()
+        interval = now - self._last_keystroke_time
+        self._last_keystroke_time = now
+
         if len(text) >= 2:
-            # タイマーをリセットして500ms後に検索実行
-            self.search_timer.start(500)
+            # タイマーをリセットして検索実行（連続入力中は長めに待つ）
+            if interval < self.FAST_TYPING_INTERVAL:
+                self.search_timer.start(self.SEARCH_DELAY_TYPING_MS)
+            else:
+                self.search_timer.start(self.SEARCH_DELAY_IDLE_MS)
         else:
             self.search_timer.stop()
             self._clear_results()
 
     def on_perform_search(self):
         """検索実行"""
+        # Enter・検索ボタンで実行した場合は待機中のデバウンス検索を取り消す
+        self.search_timer.stop()
+
         search_text = self.search_input.text().strip()
 
         if len(search_text) < 2:
@@ -198,29 +517,119 @@ class SearchTab(QWidget):
 
         self.search_status.setText("検索中...")
 
+        if self.db_manager:
+            # 未着手の検索は不要になるため取り消してから新しい検索を登録
+            self._search_pool.clear()
+
+            # 前回の検索語に文字を追加しただけなら、前回の結果から絞り込む
+            if self._can_narrow_results(search_katakana):
+                self._pending_search = None
+                results = self._narrow_results(search_katakana)
+                self._last_query = search_katakana
+                self._last_results = results
+                self._display_search_results(results, search_text)
+                return
+
+            self._pending_search = search_text
+            task = SearchTask(
+                self.db_manager, search_text, search_katakana, self.SEARCH_LIMIT
+            )
+            task.signals.finished.connect(self._on_search_finished)
+            task.signals.failed.connect(self._on_search_failed)
+            self._search_pool.start(task)
+            return
+
         try:
-            if self.db_manager:
-                results = self.db_manager.search_medicines(search_katakana, limit=200)
-            else:
-                # DBが使用できない場合はダミーデータで検索
-                results = self._simulate_search(search_katakana)
+            # DBが使用できない場合はダミーデータで検索
+            results = self._simulate_search(search_katakana)
+            self._display_search_results(results, search_text)
+
+        except Exception as e:
+            self._show_search_error(str(e))
 
+    def _on_search_finished(self, search_text, results):
+        """DB検索完了時の処理"""
+        # 後から別の検索が実行された場合は古い結果を破棄
+        if search_text != self._pending_search:
+            return
+        self._pending_search = None
+        self._last_query = normalize_to_katakana(search_text)
+        self._last_results = results
+
+        try:
             self._display_search_results(results, search_text)
 
         except Exception as e:
-            self.search_status.setText(f"検索エラー：{str(e)}")
-            QMessageBox.warning(
-                self, "検索エラー", f"検索中にエラーが発生しました：\n{str(e)}"
+            self._show_search_error(str(e))
+
+    def _can_narrow_results(self, query):
+        """
+        前回のDB検索結果からの絞り込みで検索できるか判定
+
+        前回の検索語の末尾に文字を追加しただけで、前回の結果が件数上限に
+        達していない（該当する薬剤をすべて含んでいる）場合のみ絞り込める
+
+        Args:
+            query: カタカナ変換後の検索クエリ
+        """
+        return (
+            self._last_query is not None
+            and query.startswith(self._last_query)
+            and len(self._last_results) < self.SEARCH_LIMIT
+        )
+
+    def _narrow_results(self, query):
+        """
+        前回のDB検索結果を検索クエリで絞り込み
+
+        DB検索と同じく空白区切りの各語の部分一致（大文字・小文字は区別しない）で
+        絞り込み、先頭の語で前方一致する薬剤を先に並べる
+
+        Args:
+            query: カタカナ変換後の検索クエリ
+
+        Returns:
+            絞り込んだ検索結果のリスト
+        """
+        terms = query.casefold().split()
+        narrowed = []
+        for medicine in self._last_results:
+            medicine_name = medicine["medicine_name"].casefold()
+            ingredient_name = medicine["ingredient_name"].casefold()
+            if all(term in medicine_name or term in ingredient_name for term in terms):
+                narrowed.append((medicine_name, ingredient_name, medicine))
+
+        # 前方一致を先頭に（それ以外の並びは前回の結果の順を保つ）
+        narrowed.sort(
+            key=lambda entry: (
+                not (entry[0].startswith(terms[0]) or entry[1].startswith(terms[0]))
             )
+        )
+        return [medicine for _, _, medicine in narrowed]
+
+    def _on_search_failed(self, search_text, error):
+        """DB検索失敗時の処理"""
+        if search_text != self._pending_search:
+            return
+        self._pending_search = None
+
+        self._show_search_error(error)
+
+    def _show_search_error(self, error):
+        """検索エラーを表示"""
+        self.search_status.setText(f"検索エラー：{error}")
+        QMessageBox.warning(
+            self, "検索エラー", f"検索中にエラーが発生しました：\n{error}"
+        )
 
     def on_clear_search(self):
         """検索クリア"""
         self.search_input.clear()
         self._clear_results()
 
-    def on_medicine_selected(self, item):
+    def on_medicine_selected(self, index):
         """薬剤選択"""
-        medicine_data = item.data(Qt.ItemDataRole.UserRole)
+        medicine_data = self.results_model.medicine(index.row())
         if medicine_data:
             self._show_medicine_detail(medicine_data)
             self.add_button.setEnabled(True)
@@ -243,7 +652,7 @@ class SearchTab(QWidget):
             if price > 0:
                 display_text += f" (¥{price:.2f})"
 
-            prescription_tab.confirmed_list.addItem(display_text)
+            prescription_tab.add_confirmed_item(display_text, self.selected_medicine)
 
             # 成功メッセージ
             QMessageBox.information(
@@ -261,29 +670,21 @@ class SearchTab(QWidget):
 
     def _clear_results(self):
         """検索結果クリア"""
-        self.results_list.clear()
+        # 結果待ちの検索があれば、その結果は表示しない
+        self._pending_search = None
+        self._last_query = None
+        self._last_results = []
+        self.results_model.set_medicines([])
         self.result_count_label.setText("0件")
         self.search_status.setText("薬剤名を入力して検索してください")
         self.detail_text.clear()
+        self._detail_html = None
         self.add_button.setEnabled(False)
 
     def _display_search_results(self, results, search_text):
         """検索結果を表示"""
-        self.results_list.clear()
-
-        for medicine in results:
-            # リストアイテムのテキスト作成
-            price_text = (
-                f"¥{medicine['price']:.2f}" if medicine["price"] > 0 else "価格未設定"
-            )
-            manufacturer_text = medicine["manufacturer"]
-            item_text = (
-                f"{medicine['medicine_name']} | {manufacturer_text} | {price_text}"
-            )
-
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, medicine)
-            self.results_list.addItem(item)
+        # 表示テキストはモデルが表示中の行のみ作成する
+        self.results_model.set_medicines(results)
 
         # 検索状態更新
         count = len(results)
@@ -302,184 +703,22 @@ class SearchTab(QWidget):
 
     def _show_medicine_detail(self, medicine_data):
         """薬剤詳細情報表示"""
-        detail_html = f"""
-        <h3 style="color: #007ACC;">
-            {medicine_data["medicine_name"]}
-        </h3>
-        <table style="width: 100%; border-collapse: collapse; margin-top: 20px;">
-            <tr style="background-color: #f5f5f5;">
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                成分名</td>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                {medicine_data["ingredient_name"]}</td>
-            </tr>
-            <tr>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                規格</td>
-                <td style="padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                {medicine_data["specification"]}</td>
-            </tr>
-            <tr style="background-color: #f5f5f5;">
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                区分</td>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                {medicine_data["classification"]}</td>
-            </tr>
-            <tr>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                薬価</td>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                ¥{medicine_data["price"]}</td>
-            </tr>
-            <tr style="background-color: #f5f5f5;">
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                薬剤分類</td>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                {medicine_data["medicine_type"]}</td>
-            </tr>
-            <tr>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                ">
-                メーカー</td>
-                <td style="
-                padding: 8px;
-                border: 1px solid #ddd;
-                ">
-                {medicine_data["manufacturer"]}</td>
-            </tr>
-        </table>
-        <h4 style="color: #333; margin-top: 20px;">基本情報</h4>
-        <p style="line-height: 1.6; color: #555;">
-        この薬剤の詳細な効能・効果、用法・用量、副作用等の情報は、
-        実際の添付文書を確認してください。
-        </p>
-        <p style="font-size: 12px; color: #888; margin-top: 20px;">
-        ※ 本システムの薬剤情報は参考用です。必ず最新の添付文書をご確認ください。
-        </p>
-        """
+        # 表示項目をHTMLエスケープしてテンプレートに埋め込む
+        fields = {key: html.escape(str(value)) for key, value in medicine_data.items()}
+        detail_html = DETAIL_HTML_TEMPLATE.format_map(fields)
 
+        # 表示中と同じ内容ならHTMLの解析・レイアウトをやり直さない
+        if detail_html == self._detail_html:
+            return
+        self._detail_html = detail_html
         self.detail_text.setHtml(detail_html)
 
     def _simulate_search(self, search_katakana):
         """DB接続失敗時のダミーデータ検索"""
-        dummy_medicines = [
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アスピリン",
-                "specification": "100mg1錠",
-                "medicine_name": "アスピリン錠100mg",
-                "manufacturer": "バイエル薬剤",
-                "price": 5.90,
-                "medicine_type": "後発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アスピリン",
-                "specification": "81mg1錠",
-                "medicine_name": "アスピリン錠81mg",
-                "manufacturer": "バイエル薬剤",
-                "price": 5.40,
-                "medicine_type": "後発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アスピリン",
-                "specification": "100mg1錠",
-                "medicine_name": "アスピリン腸溶錠100mg",
-                "manufacturer": "武田薬剤",
-                "price": 6.10,
-                "medicine_type": "先発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "ロキソプロフェンナトリウム水和物",
-                "specification": "60mg1錠",
-                "medicine_name": "ロキソプロフェン錠60mg",
-                "manufacturer": "第一三共",
-                "price": 9.60,
-                "medicine_type": "後発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "ロキソプロフェンナトリウム水和物",
-                "specification": "60mg1錠",
-                "medicine_name": "ロキソニン錠60mg",
-                "manufacturer": "第一三共",
-                "price": 22.10,
-                "medicine_type": "先発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アセトアミノフェン",
-                "specification": "200mg1錠",
-                "medicine_name": "カロナール錠200mg",
-                "manufacturer": "あゆみ製薬",
-                "price": 5.70,
-                "medicine_type": "先発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アセトアミノフェン",
-                "specification": "300mg1錠",
-                "medicine_name": "カロナール錠300mg",
-                "manufacturer": "あゆみ製薬",
-                "price": 6.20,
-                "medicine_type": "先発品",
-            },
-            {
-                "classification": "内用薬",
-                "ingredient_name": "アセトアミノフェン",
-                "specification": "300mg1錠",
-                "medicine_name": "タイレノールA",
-                "manufacturer": "東亜薬剤",
-                "price": 15.80,
-                "medicine_type": "その他",
-            },
-        ]
-
-        # 検索文字列でフィルタリング
-        filtered_medicines = [
-            medicine
-            for medicine in dummy_medicines
+        # 検索文字列でフィルタリング（DB検索と同じく呼び出し側には複製を返す）
+        return [
+            dict(medicine)
+            for medicine in self.DUMMY_MEDICINES
             if medicine["medicine_name"].startswith(search_katakana)
             or medicine["ingredient_name"].startswith(search_katakana)
         ]
-
-        return filtered_medicines
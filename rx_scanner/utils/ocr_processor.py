@@ -8,18 +8,88 @@ import os
 import platform
 import re
 import shutil
-from collections import defaultdict
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 import cv2
 import numpy as np
 import pytesseract
 from PIL import Image
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from rx_scanner.database.db_manager import DatabaseManager
+from rx_scanner.database.db_manager import get_db_manager
 from rx_scanner.utils.text_utils import normalize_to_katakana
 
+# 全角数字・小数点→半角の変換テーブル
+FULLWIDTH_DIGIT_TABLE = str.maketrans("０１２３４５６７８９．", "0123456789.")
+
+# 規格の数値部分の抽出パターン
+SPEC_VALUE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_spec_value(specification: str) -> float:
+    """
+    規格から数値を抽出（同じ規格は行・処方箋をまたいで再利用）
+
+    Args:
+        specification: 規格文字列
+
+    Returns:
+        抽出された数値（数値がない場合はfloat("inf")）
+    """
+    # 全角を半角に変換
+    spec_normalized = specification.translate(FULLWIDTH_DIGIT_TABLE)
+
+    # 最初の数値を抽出
+    match = SPEC_VALUE_PATTERN.search(spec_normalized)
+    return float(match.group(1)) if match else float("inf")
+
+
+def _contains_spec(text: str, spec: str) -> bool:
+    """
+    規格が数値の途中からではなく含まれているか判定（例: "5mg"は"2.5mg"に一致しない）
+
+    正規表現の後読み(?<![0-9.])と同じ判定をstr.findで行う
+
+    Args:
+        text: 正規化済みの薬剤名
+        spec: 正規化済みの規格
+
+    Returns:
+        含まれている場合True
+    """
+    start = text.find(spec)
+    while start != -1:
+        if start == 0 or text[start - 1] not in "0123456789.":
+            return True
+        start = text.find(spec, start + 1)
+    return False
+
+
+@lru_cache(maxsize=8192)
+def _normalize_medicine_name(medicine_name: str) -> str:
+    """
+    薬剤名の単位・数字を半角に正規化（同じ薬剤名は行・処方箋をまたいで再利用）
+
+    Args:
+        medicine_name: 薬剤名
+
+    Returns:
+        正規化済み薬剤名
+    """
+    return (
+        medicine_name.replace("ｍｇ", "mg")
+        .replace("ｇ", "g")
+        .replace("ｍＬ", "mL")
+        .replace("％", "%")
+        .translate(FULLWIDTH_DIGIT_TABLE)
+    )
+
 
 class OCRProcessor:
     """OCR処理クラス"""
@@ -57,19 +127,45 @@ class OCRProcessor:
         "点耳",
     ]
 
+    # 長い順に並べた剤形（同じ長さはDOSAGE_FORMSの定義順、最初の一致が最長一致）
+    DOSAGE_FORMS_BY_LENGTH = tuple(sorted(DOSAGE_FORMS, key=len, reverse=True))
+
+    # 薬剤名候補（カタカナ・漢字の連続）の抽出パターン
+    WORD_PATTERN = re.compile(
+        r"[ア-ンヴガ-ゴザ-ゾダ-ドバ-ボパ-ポヤャユュヨョワヮヰヱヲッー一-龯]+"
+    )
+
+    # 規格（数値+単位）の抽出パターン
+    SPEC_PATTERN = re.compile(
+        r"([\d０-９]+(?:[．\.][\d０-９]+)?(?:mg|ｍｇ|g|ｇ|mL|ｍＬ|ml|μg|μｇ|％|%))"
+    )
+
+    # 縮小デコード（1/2）を使う画像の拡張子と最小幅（px、これ未満は等倍で読み込む）
+    # JPEGはDCT段階で縮小できるため高速だが、PNG等は全体をデコードしてから縮小される
+    REDUCED_DECODE_SUFFIXES = (".jpg", ".jpeg")
+    REDUCED_DECODE_MIN_WIDTH = 3000
+
+    # 複数画像を並列OCRする際の最大ワーカー数
+    OCR_MAX_WORKERS = os.cpu_count() or 1
+
+    # Tesseractのパス設定済みフラグ（見つかった後はプロセス内で再探索しない）
+    _tesseract_path_configured = False
+
     # ストップワード
-    STOP_WORDS = [
-        "キット",
-        "セット",
-        "バッグ",
-    ]
+    STOP_WORDS = frozenset(
+        {
+            "キット",
+            "セット",
+            "バッグ",
+        }
+    )
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
         # DB接続
         try:
-            self.db_manager = DatabaseManager()
+            self.db_manager = get_db_manager()
         except Exception as e:
             self.db_manager = None
             self.logger.error(f"Database initialization failed: {e}")
@@ -106,8 +202,85 @@ class OCRProcessor:
 
         return result
 
+    def process_images(self, image_paths: list[str]) -> list[dict]:
+        """
+        複数画像をまとめてOCR処理（Tesseractの起動を1回にまとめる）
+
+        前処理済みの各画像を一時ファイルに書き出し、その一覧ファイルを
+        Tesseractに渡して1プロセスで全画像を処理する。結果はページ番号で
+        画像ごとに振り分ける。解析前のテキスト領域のみが必要な場合は
+        extract_text_regions_batchを使用する。
+
+        Args:
+            image_paths: 画像ファイルパスのリスト
+
+        Returns:
+            画像ごとの解析済み処方箋データのリスト（入力と同じ順序）
+        """
+        if not image_paths:
+            return []
+
+        # 前処理
+        pages = [self._preprocess_image(image_path) for image_path in image_paths]
+
+        # テキスト領域抽出（1回のOCR）を画像ごとに振り分け
+        text_regions_per_page = [[] for _ in pages]
+        for text, line_num, page_index in self._ocr_words(pages):
+            text_regions_per_page[page_index].append((text, line_num))
+
+        self.logger.info(f"Batch OCR processed {len(pages)} images")
+
+        # 処方箋テキスト解析
+        return [
+            self._parse_prescription_text(text_regions)
+            for text_regions in text_regions_per_page
+        ]
+
+    def extract_text_regions_batch(
+        self, image_paths: list[str]
+    ) -> list[list[tuple[str, int]]]:
+        """
+        複数画像の前処理・OCRを画像ごとに並列実行
+
+        Tesseractは呼び出しごとに別プロセスで起動され、OpenCVの処理もGILを解放する
+        ため、スレッドから呼び出すだけでコア数に応じて並列化される
+
+        複数のTesseractを同時に動かすとOpenMPの内部並列が競合して遅くなるため、
+        環境変数OMP_THREAD_LIMIT=1で起動すること（アプリではmainで設定済み）
+
+        処方箋解析前の生のテキスト領域が必要な場合に使用する。解析済みの
+        処方箋データが必要な場合はprocess_imagesを使用する（Tesseractの起動が
+        1回で済むため、コア数が少ない環境ではこちらより速い）
+
+        Args:
+            image_paths: 画像ファイルパスのリスト
+
+        Returns:
+            画像ごとの(テキスト, 行番号)のタプルのリスト（入力と同じ順序）
+        """
+        if not image_paths:
+            return []
+
+        max_workers = min(len(image_paths), self.OCR_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            text_regions_per_image = list(
+                executor.map(
+                    lambda image_path: self._extract_text_regions(
+                        self._preprocess_image(image_path)
+                    ),
+                    image_paths,
+                )
+            )
+
+        self.logger.info(f"Parallel OCR processed {len(image_paths)} images")
+        return text_regions_per_image
+
     def _preprocess_image(
-        self, image_path: str, scale: float = 2, denoise: int = 0
+        self,
+        image_path: str,
+        scale: float = 2,
+        denoise: int = 0,
+        interpolation: int = cv2.INTER_LINEAR,
     ) -> np.ndarray:
         """
         画像前処理（最適化版）
@@ -116,22 +289,14 @@ class OCRProcessor:
             image_path: 画像ファイルパス
             scale: 拡大率
             denoise: ノイズ除去強度（0 = なし）
+            interpolation: 拡大時の補間方法（OCR用途ではバイリニアで十分）
 
         Returns:
             前処理済み画像（numpy配列）
         """
         try:
-            # 画像の読み込み
-            image = cv2.imread(image_path)
-            if image is None:
-                if not Path(image_path).exists():
-                    raise FileNotFoundError(
-                        f"画像ファイルが見つかりません: {image_path}"
-                    )
-                raise ValueError(f"画像形式が不正です: {image_path}")
-
-            # グレースケール変換
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            # 画像の読み込み（デコード時に直接グレースケール化）
+            gray, decode_scale = self._read_grayscale(image_path)
 
             # 上下30%をクロップ（処方箋の中央部分のみを使用）
             height, width = gray.shape
@@ -139,20 +304,26 @@ class OCRProcessor:
             y_end = int(height * 0.70)
             gray = gray[y_start:y_end, :]
 
-            # 画像を拡大してOCR精度を向上
+            # 画像を拡大してOCR精度を向上（縮小デコードした分も補正し、
+            # 出力サイズは元画像に対する拡大率で決まるようにする）
             height, width = gray.shape
+            resize_scale = scale * decode_scale
             enlarged = cv2.resize(
                 gray,
-                (int(width * scale), int(height * scale)),
-                interpolation=cv2.INTER_CUBIC,
+                (int(width * resize_scale), int(height * resize_scale)),
+                interpolation=interpolation,
             )
 
-            # ノイズ除去
-            denoised = cv2.fastNlMeansDenoising(enlarged, h=denoise)
+            # ノイズ除去（強度0では結果が変わらないため、重い処理自体をスキップ）
+            if denoise > 0:
+                denoised = cv2.fastNlMeansDenoising(enlarged, h=denoise)
+            else:
+                denoised = enlarged
 
             # 大津の二値化（自動閾値）
+            # 拡大・ノイズ除去で新たに確保した中間バッファに上書きし、出力用の確保を省く
             _, binary = cv2.threshold(
-                denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+                denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=denoised
             )
 
             self.logger.info(
@@ -164,6 +335,58 @@ class OCRProcessor:
             self.logger.error(f"Image preprocessing failed: {e}")
             raise
 
+    def _read_grayscale(self, image_path: str) -> tuple[np.ndarray, int]:
+        """
+        画像をグレースケールで読み込む
+
+        高解像度のJPEG（スマートフォンの写真など）はlibjpegのDCT縮小デコードで
+        1/2サイズのまま読み込み、デコード時間とメモリを削減する
+
+        Args:
+            image_path: 画像ファイルパス
+
+        Returns:
+            (グレースケール画像, 元画像に対する縮小率の逆数)のタプル
+
+        Raises:
+            FileNotFoundError: 画像ファイルが存在しない場合
+            ValueError: 画像として読み込めない場合
+        """
+        if self._should_reduce_decode(image_path):
+            reduced = cv2.imread(image_path, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+            if reduced is not None:
+                return reduced, 2
+
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            if not Path(image_path).exists():
+                raise FileNotFoundError(f"画像ファイルが見つかりません: {image_path}")
+            raise ValueError(f"画像形式が不正です: {image_path}")
+
+        return gray, 1
+
+    def _should_reduce_decode(self, image_path: str) -> bool:
+        """
+        縮小デコードの対象か判定（ヘッダーのみ読み込んで画像サイズを確認）
+
+        Args:
+            image_path: 画像ファイルパス
+
+        Returns:
+            高解像度のJPEGの場合True
+        """
+        if Path(image_path).suffix.lower() not in self.REDUCED_DECODE_SUFFIXES:
+            return False
+
+        try:
+            with Image.open(image_path) as header:
+                width, _ = header.size
+        except (OSError, ValueError):
+            # 読み込めない場合は等倍デコード側でエラーを判定する
+            return False
+
+        return width >= self.REDUCED_DECODE_MIN_WIDTH
+
     def _extract_text_regions(self, image: np.ndarray) -> list[tuple[str, int]]:
         """
         テキスト領域を抽出してOCR処理
@@ -174,32 +397,83 @@ class OCRProcessor:
         Returns:
             (テキスト, 行番号)のタプルのリスト
         """
+        return [(text, line_num) for text, line_num, _ in self._ocr_words([image])]
+
+    def _ocr_words(self, images: list[np.ndarray]) -> list[tuple[str, int, int]]:
+        """
+        OCRを実行し、信頼度でフィルタした単語を画像の番号付きで返す
+
+        複数画像の場合は画像パスの一覧ファイルを渡し、1回のTesseract起動で処理する
+
+        Args:
+            images: 前処理済み画像のリスト
+
+        Returns:
+            (テキスト, 行番号, 画像のインデックス)のタプルのリスト
+        """
         try:
-            # PILイメージに変換
-            pil_image = Image.fromarray(image)
-
-            # OCR実行
-            data = pytesseract.image_to_data(
-                pil_image,
-                lang=self.tesseract_config["lang"],
-                config=self.tesseract_config["config"],
-                output_type=pytesseract.Output.DICT,
-            )
+            with tempfile.TemporaryDirectory(prefix="rx_scanner_") as temp_dir:
+                input_paths = []
+                for index, image in enumerate(images):
+                    # 非圧縮のPGMにエンコード（PIL経由のPNG再エンコードを省略）
+                    # cv2.imwriteは非ASCIIパスを扱えないため、バイト列として書き出す
+                    success, encoded = cv2.imencode(".pgm", image)
+                    if not success:
+                        raise ValueError("OCR入力画像のエンコードに失敗しました")
+
+                    input_path = Path(temp_dir) / f"ocr_input_{index}.pgm"
+                    input_path.write_bytes(encoded.tobytes())
+                    input_paths.append(str(input_path))
+
+                # 複数画像はTesseractが解釈できる画像パスの一覧ファイルにまとめる
+                if len(input_paths) == 1:
+                    tesseract_input = input_paths[0]
+                else:
+                    list_path = Path(temp_dir) / "ocr_inputs.txt"
+                    list_path.write_text(
+                        "\n".join(input_paths) + "\n", encoding="utf-8"
+                    )
+                    tesseract_input = str(list_path)
+
+                # OCR実行（ファイルパスを渡すとpytesseractは画像を再保存しない）
+                # 全列を数値変換する辞書形式ではなく、TSVのまま受け取り必要な列のみ解析
+                tsv = pytesseract.image_to_data(
+                    tesseract_input,
+                    lang=self.tesseract_config["lang"],
+                    config=self.tesseract_config["config"],
+                    output_type=pytesseract.Output.STRING,
+                )
+
+            rows = tsv.splitlines()
+            if not rows:
+                return []
+
+            header = rows[0].split("\t")
+            page_col = header.index("page_num")
+            line_col = header.index("line_num")
+            conf_col = header.index("conf")
+            text_col = header.index("text")
 
             # テキストと行番号を抽出（信頼度でフィルタリング）
             text_regions = []
-            n_boxes = len(data["text"])
+            for row in rows[1:]:
+                cells = row.split("\t")
 
-            for i in range(n_boxes):
-                text = data["text"][i].strip()
-                conf = int(data["conf"][i])
+                # 空のテキストはスキップ（単語以外の階層の行はテキスト列が空か欠落）
+                if len(cells) <= text_col:
+                    continue
+                text = cells[text_col].strip()
+                if not text:
+                    continue
 
-                # 信頼度が低い or 空のテキストはスキップ
-                if conf < 30 or not text:
+                # 信頼度が低いものはスキップ
+                if float(cells[conf_col]) < 30:
                     continue
 
-                line_num = data["line_num"][i]
-                text_regions.append((text, line_num))
+                # page_numは1始まり（一覧ファイルの画像順）
+                text_regions.append(
+                    (text, int(cells[line_col]), int(cells[page_col]) - 1)
+                )
 
             self.logger.info(f"Extracted {len(text_regions)} text regions")
             return text_regions
@@ -220,17 +494,15 @@ class OCRProcessor:
         """
         try:
             # UI表示用の全テキスト
-            all_text = "".join([text for text, _ in text_regions])
-
-            # 行ごとにグループ化
-            lines = defaultdict(list)
-            for text, line_num in text_regions:
-                lines[line_num].append(text)
+            all_text = "".join(text for text, _ in text_regions)
 
-            # 各行から薬剤を抽出
+            # 各行から薬剤を抽出（Tesseractの出力は行順に並んでいるため、
+            # 連続する同じ行番号の単語をそのまま1行としてまとめる）
             all_medicines = []
-            for line_words in lines.values():
-                line_text = "".join(line_words)
+            line_count = 0
+            for _, line_words in groupby(text_regions, key=itemgetter(1)):
+                line_text = "".join(text for text, _ in line_words)
+                line_count += 1
 
                 # テキスト正規化（ひらがな→カタカナ）
                 normalized_line_text = normalize_to_katakana(line_text)
@@ -247,7 +519,7 @@ class OCRProcessor:
 
             self.logger.info(
                 f"Parsed prescription: {len(all_medicines)} medicines found "
-                f"from {len(lines)} lines"
+                f"from {line_count} lines"
             )
             return result
 
@@ -263,16 +535,23 @@ class OCRProcessor:
         1. TESSERACT_CMD環境変数（カスタムパス）
         2. システムPATH
         3. OS別の標準インストール先（macOS/Windows）
+
+        見つかった場合はプロセス内で共有されるため、2回目以降の生成では探索を省略する
         """
+        if OCRProcessor._tesseract_path_configured:
+            return
+
         # 環境変数チェック（最優先）
         tesseract_env = os.environ.get("TESSERACT_CMD")
         if tesseract_env and Path(tesseract_env).exists():
             pytesseract.pytesseract.tesseract_cmd = tesseract_env
+            OCRProcessor._tesseract_path_configured = True
             self.logger.info(f"Using TESSERACT_CMD: {tesseract_env}")
             return
 
         # PATHチェック
         if shutil.which("tesseract"):
+            OCRProcessor._tesseract_path_configured = True
             self.logger.info("Tesseract found in PATH")
             return
 
@@ -302,6 +581,7 @@ class OCRProcessor:
         for path in possible_paths:
             if Path(path).exists():
                 pytesseract.pytesseract.tesseract_cmd = path
+                OCRProcessor._tesseract_path_configured = True
                 self.logger.info(f"Tesseract path set to: {path}")
                 return
 
@@ -356,13 +636,27 @@ class OCRProcessor:
 
             self.logger.info(f"OCR extracted forms: {ocr_forms}, specs: {ocr_specs}")
 
-            # カタカナ全字と漢字の連続を抽出
-            words = re.findall(
-                r"[ア-ンヴガ-ゴザ-ゾダ-ドバ-ボパ-ポヤャユュヨョワヮヰヱヲッー一-龯]+",
-                text,
+            # カタカナ全字と漢字の連続を抽出（3文字以上のみ、重複は出現順に1つへ）
+            # 同じ単語のマッチ結果は成分ごとの選択で必ず1つにまとまるため、1回で十分
+            words = list(
+                dict.fromkeys(
+                    word for word in self.WORD_PATTERN.findall(text) if len(word) >= 3
+                )
+            )
+
+            # 照合する規格（行内で共通）
+            ocr_spec = ocr_specs[0] if ocr_specs else None
+
+            # DB検索（行内の全単語を1回にまとめて検索）
+            search_words = [word for word in words if word not in self.STOP_WORDS]
+            search_results = self.db_manager.search_medicines_batch(
+                search_words, limit=5
+            )
+
+            # 類似度検索の候補（前方3文字）もまとめて取得
+            similarity_candidates = self.db_manager.search_medicines_batch(
+                [word[:3] for word in search_words if len(word) >= 7], limit=100
             )
-            # 3文字以上のみフィルタ
-            words = [word for word in words if len(word) >= 3]
 
             matches = []
 
@@ -372,12 +666,13 @@ class OCRProcessor:
                     self.logger.debug(f"Skipping stop word: {word}")
                     continue
 
-                # DB検索
-                results = self.db_manager.search_medicines(word, limit=5)
+                results = list(search_results[word])
 
                 # 7文字以上の単語の場合、類似度検索を追加（OCRエラー対応）
                 if len(word) >= 7:
-                    similarity_results = self._search_by_similarity(word)
+                    similarity_results = self._search_by_similarity(
+                        word, candidates=similarity_candidates[word[:3]]
+                    )
                     results.extend(similarity_results)
 
                 for result in results:
@@ -416,23 +711,14 @@ class OCRProcessor:
                             form_match = True
 
                         # 規格マッチング
-                        if ocr_specs:
+                        if ocr_spec:
                             # 薬剤名を正規化（全角→半角）
-                            medicine_normalized = (
-                                medicine_name.replace("ｍｇ", "mg")
-                                .replace("ｇ", "g")
-                                .replace("ｍＬ", "mL")
-                                .replace("％", "%")
-                                .translate(
-                                    str.maketrans(
-                                        "０１２３４５６７８９．", "0123456789."
-                                    )
-                                )
+                            medicine_normalized = _normalize_medicine_name(
+                                medicine_name
                             )
 
-                            # 正規表現で完全一致
-                            pattern = r"(?<![0-9.])" + re.escape(ocr_specs[0])
-                            if re.search(pattern, medicine_normalized):
+                            # 数値の途中からの一致を除いて完全一致
+                            if _contains_spec(medicine_normalized, ocr_spec):
                                 spec_match = True
 
                         # 剤形・規格の両方がマッチした場合、信頼度を向上
@@ -476,27 +762,21 @@ class OCRProcessor:
         Returns:
             {"forms": [...], "specs": [...]} の辞書
         """
-        # 剤形を抽出
+        # 剤形を抽出（最長の剤形のみ採用: "錠"と"OD錠"が両方含まれる場合は"OD錠"）
         found_forms = []
-        for form in self.DOSAGE_FORMS:
+        for form in self.DOSAGE_FORMS_BY_LENGTH:
             if form in text:
-                found_forms.append(form)
-
-        # 最長の剤形のみ採用（"錠"と"OD錠"が両方マッチした場合は"OD錠"を優先）
-        if found_forms:
-            found_forms = [max(found_forms, key=len)]
+                found_forms = [form]
+                break
 
         # 規格を抽出
-        spec_pattern = (
-            r"([\d０-９]+(?:[．\.][\d０-９]+)?(?:mg|ｍｇ|g|ｇ|mL|ｍＬ|ml|μg|μｇ|％|%))"
-        )
         found_specs = [
             spec.replace("ｍｇ", "mg")
             .replace("ｍＬ", "mL")
             .replace("ｇ", "g")
             .replace("％", "%")
-            .translate(str.maketrans("０１２３４５６７８９．", "0123456789."))
-            for spec in re.findall(spec_pattern, text)
+            .translate(FULLWIDTH_DIGIT_TABLE)
+            for spec in self.SPEC_PATTERN.findall(text)
         ]
 
         # 最初の規格のみ採用（1行に1つの規格が基本）
@@ -508,7 +788,10 @@ class OCRProcessor:
         return {"forms": found_forms, "specs": found_specs}
 
     def _search_by_similarity(
-        self, keyword: str, min_similarity: float = 0.70
+        self,
+        keyword: str,
+        min_similarity: float = 0.70,
+        candidates: list[dict] | None = None,
     ) -> list[dict]:
         """
         類似度検索（OCRエラー対応）
@@ -516,6 +799,7 @@ class OCRProcessor:
         Args:
             keyword: 検索キーワード
             min_similarity: 最小類似度（0.0〜1.0）
+            candidates: 検索済みの候補（未指定の場合は前方3文字でDB検索）
 
         Returns:
             類似度でフィルタされた検索結果のリスト
@@ -530,37 +814,51 @@ class OCRProcessor:
                 return []
 
             # FTS検索で候補取得（前方3文字）
-            prefix = keyword[:3]
-            candidates = self.db_manager.search_medicines(prefix, limit=100)
+            if candidates is None:
+                prefix = keyword[:3]
+                candidates = self.db_manager.search_medicines(prefix, limit=100)
 
-            # 類似度を計算してフィルタ
-            results = []
-            for candidate in candidates:
-                ingredient_name = candidate["ingredient_name"]
-                medicine_name = candidate["medicine_name"]
-
-                # キーワードと同じ長さで比較（長さの違いによる類似度低下を防ぐ）
-                keyword_len = len(keyword)
-
-                # 成分名との類似度
-                ingredient_name_short = ingredient_name[:keyword_len]
-                ingredient_similarity = self._calculate_similarity(
-                    keyword, ingredient_name_short
-                )
+            if not candidates:
+                return []
 
-                # 薬剤名との類似度
-                medicine_name_short = medicine_name[:keyword_len]
-                medicine_similarity = self._calculate_similarity(
-                    keyword, medicine_name_short
-                )
+            # キーワードと同じ長さで比較（長さの違いによる類似度低下を防ぐ）
+            keyword_len = len(keyword)
+            ingredient_names_short = [
+                candidate["ingredient_name"][:keyword_len] for candidate in candidates
+            ]
+            medicine_names_short = [
+                candidate["medicine_name"][:keyword_len] for candidate in candidates
+            ]
 
-                # 高い方を採用
-                similarity = max(ingredient_similarity, medicine_similarity)
+            # 成分名・薬剤名との類似度を一括計算し、高い方を採用
+            # fuzz.ratio()は0-100の範囲を返すので、100で割って0.0-1.0に変換
+            # score_cutoff: 閾値に届かない候補は計算を打ち切って0を返す
+            score_cutoff = min_similarity * 100
+            ingredient_similarities = process.cdist(
+                [keyword],
+                ingredient_names_short,
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+            )[0]
+            medicine_similarities = process.cdist(
+                [keyword],
+                medicine_names_short,
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+            )[0]
+            similarities = (
+                np.maximum(ingredient_similarities, medicine_similarities) / 100.0
+            )
 
+            # 類似度でフィルタ
+            results = []
+            for candidate, similarity in zip(candidates, similarities, strict=True):
                 if similarity >= min_similarity:
                     # 類似度検索でヒットしたことを示すフラグのみ設定
-                    candidate["is_similarity_match"] = True
-                    results.append(candidate)
+                    # （候補は他の単語と共有されるためコピーに設定）
+                    results.append({**candidate, "is_similarity_match": True})
 
             self.logger.debug(
                 f"Similarity search '{keyword}' "
@@ -573,30 +871,12 @@ class OCRProcessor:
             self.logger.warning(f"Similarity search failed for '{keyword}': {e}")
             return []
 
-    def _calculate_similarity(self, s1: str, s2: str) -> float:
-        """
-        文字列の類似度を計算（0.0〜1.0）
-
-        Args:
-            s1: 文字列1
-            s2: 文字列2
-
-        Returns:
-            類似度（1.0 = 完全一致、0.0 = 全く異なる）
-        """
-        if not s1 or not s2:
-            return 0.0
-
-        # rapidfuzzのレーベンシュタイン距離ベースの類似度を使用
-        # fuzz.ratio()は0-100の範囲を返すので、100で割って0.0-1.0に変換
-        return fuzz.ratio(s1, s2) / 100.0
-
     def _select_best_medicine_per_ingredient(self, medicines: list[dict]) -> list[dict]:
         """
-        成分ごとに最適な薬剤を1つ選択（2段階）
+        成分ごとに最適な薬剤を1つ選択（1パス）
 
-        第1段階: (成分名, 規格) で重複除去 → 信頼度が高い方を優先
-        第2段階: 成分ごとに1つ選択 → 信頼度が高い方、同じなら規格値が低い方を優先
+        信頼度が高い方、同じなら規格値が低い方を優先する
+        （同じ規格の重複もこの比較でまとめて除去される）
 
         Args:
             medicines: 薬剤情報のリスト
@@ -607,48 +887,25 @@ class OCRProcessor:
         if not medicines:
             return []
 
-        # 第1段階: (成分名, 規格) で重複除去
-        by_ingredient_and_spec = {}
+        # 成分名 → ((信頼度, -規格値, -初出順), 薬剤)
+        best_by_ingredient: dict[str, tuple[tuple[float, float, int], dict]] = {}
+        # (成分名, 規格) → 初出順（同順位の場合は先に出現した規格を優先）
+        first_seen: dict[tuple[str, str], int] = {}
+
         for medicine in medicines:
             ingredient = medicine["ingredient_name"]
             specification = medicine["specification"]
 
-            key = (ingredient, specification)
-            if key not in by_ingredient_and_spec:
-                by_ingredient_and_spec[key] = medicine
-            else:
-                # 信頼度が高い方を残す
-                existing = by_ingredient_and_spec[key]
-                if medicine["confidence"] > existing["confidence"]:
-                    by_ingredient_and_spec[key] = medicine
-
-        # 第2段階: 成分名のみで重複除去（規格違いを除外）
-        by_ingredient = {}
-        for medicine in by_ingredient_and_spec.values():
-            ingredient = medicine["ingredient_name"]
-            if ingredient not in by_ingredient:
-                by_ingredient[ingredient] = medicine
-            else:
-                existing = by_ingredient[ingredient]
-                new_confidence = medicine.get("confidence", 0.0)
-                existing_confidence = existing.get("confidence", 0.0)
-
-                # 信頼度が高い方を優先
-                should_replace = False
-                if new_confidence > existing_confidence:
-                    should_replace = True
-                elif new_confidence == existing_confidence:
-                    # 信頼度が同じ場合、規格値が低い方を優先
-                    new_spec_value = self._extract_spec_value(medicine["specification"])
-                    existing_spec_value = self._extract_spec_value(
-                        existing["specification"]
-                    )
-                    should_replace = new_spec_value < existing_spec_value
+            spec_value = self._extract_spec_value(specification)
+
+            order = first_seen.setdefault((ingredient, specification), len(first_seen))
 
-                if should_replace:
-                    by_ingredient[ingredient] = medicine
+            rank = (medicine.get("confidence", 0.0), -spec_value, -order)
+            best = best_by_ingredient.get(ingredient)
+            if best is None or rank > best[0]:
+                best_by_ingredient[ingredient] = (rank, medicine)
 
-        return list(by_ingredient.values())
+        return [medicine for _, medicine in best_by_ingredient.values()]
 
     def _extract_spec_value(self, specification: str) -> float:
         """
@@ -660,14 +917,7 @@ class OCRProcessor:
         Returns:
             抽出された数値（数値がない場合はfloat("inf")）
         """
-        # 全角を半角に変換
-        spec_normalized = specification.translate(
-            str.maketrans("０１２３４５６７８９．", "0123456789.")
-        )
-
-        # 最初の数値を抽出
-        match = re.search(r"(\d+(?:\.\d+)?)", spec_normalized)
-        return float(match.group(1)) if match else float("inf")
+        return _parse_spec_value(specification)
 
     def _enrich_medicine_data(self, medicines: list[dict]) -> list[dict]:
         """
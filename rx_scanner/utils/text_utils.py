@@ -1,5 +1,8 @@
 """テキスト処理ユーティリティ"""
 
+# ひらがな範囲（U+3041-U+3096）→カタカナ（U+30A1-U+30F6）の変換テーブル
+HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+
 
 def normalize_to_katakana(text: str) -> str:
     """
@@ -11,12 +14,4 @@ def normalize_to_katakana(text: str) -> str:
     Returns:
         カタカナに変換されたテキスト
     """
-    katakana = ""
-    for char in text:
-        code = ord(char)
-        # ひらがな範囲（U+3041-U+3096）をカタカナに変換
-        if 0x3041 <= code <= 0x3096:
-            katakana += chr(code + 0x60)
-        else:
-            katakana += char
-    return katakana
+    return text.translate(HIRAGANA_TO_KATAKANA)
@@ -0,0 +1,97 @@
+"""
+テスト共通のフィクスチャ
+"""
+
+import sqlite3
+
+import pytest
+
+from rx_scanner.database.db_manager import DatabaseManager
+
+# トライグラム導入前（スキーマv1）のテーブル定義
+V1_SCHEMA_SQL = """
+    CREATE TABLE medicines (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        classification TEXT NOT NULL,
+        ingredient_name TEXT NOT NULL,
+        specification TEXT NOT NULL,
+        medicine_name TEXT NOT NULL,
+        manufacturer TEXT NOT NULL,
+        price REAL NOT NULL,
+        medicine_type TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+    );
+    CREATE VIRTUAL TABLE medicines_fts USING fts5(
+        medicine_name,
+        ingredient_name,
+        content="medicines",
+        content_rowid="id",
+        prefix="2 3"
+    );
+    PRAGMA user_version = 1;
+"""
+
+MEDICINES = [
+    (
+        "内用薬",
+        "アスピリン",
+        "100mg1錠",
+        "アスピリン錠100mg",
+        "A製薬",
+        5.7,
+        "先発品",
+    ),
+    (
+        "内用薬",
+        "バファリン",
+        "81mg1錠",
+        "バファリン配合錠",
+        "B製薬",
+        5.7,
+        "先発品",
+    ),
+    (
+        "内用薬",
+        "ロキソプロフェン",
+        "60mg1錠",
+        "ロキソニン錠60mg",
+        "C製薬",
+        10.1,
+        "先発品",
+    ),
+]
+
+
+def _create_v1_database(db_path):
+    """スキーマv1のDBを作成"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(V1_SCHEMA_SQL)
+        conn.executemany(
+            """
+            INSERT INTO medicines (classification, ingredient_name, specification,
+                medicine_name, manufacturer, price, medicine_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            MEDICINES,
+        )
+        conn.execute("INSERT INTO medicines_fts (medicines_fts) VALUES ('rebuild')")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def v1_db_path(tmp_path):
+    """スキーマv1（トライグラム導入前）の薬剤DBのパス"""
+    db_path = tmp_path / "medicine_data.db"
+    _create_v1_database(db_path)
+    return db_path
+
+
+@pytest.fixture
+def medicine_db(v1_db_path):
+    """薬剤データを登録済みのDatabaseManager（最新スキーマに移行済み）"""
+    db = DatabaseManager(str(v1_db_path))
+    yield db
+    db.close()
@@ -0,0 +1,45 @@
+"""
+DatabaseManagerのテスト
+"""
+
+from rx_scanner.database.db_manager import DatabaseManager
+
+
+def test_v1_database_is_migrated_to_trigram_search(v1_db_path):
+    """v1のDBを開くとFTSが作り直され、名前の途中でも検索できる"""
+    db = DatabaseManager(str(v1_db_path))
+    try:
+        with db.get_connection() as conn:
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            fts_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'medicines_fts'"
+            ).fetchone()[0]
+
+        assert user_version == DatabaseManager.SCHEMA_VERSION
+        assert "trigram" in fts_sql
+
+        results = db.search_medicines("ピリン")
+        assert [r["medicine_name"] for r in results] == ["アスピリン錠100mg"]
+    finally:
+        db.close()
+
+
+def test_search_orders_prefix_matches_first(medicine_db):
+    """前方一致する薬剤が部分一致の薬剤より先に並ぶ"""
+    results = medicine_db.search_medicines("バファリン")
+    assert results[0]["medicine_name"] == "バファリン配合錠"
+
+    # 件数制限はFTS側で前方一致を優先した上で適用される
+    with medicine_db.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO medicines (classification, ingredient_name,
+                specification, medicine_name, manufacturer, price, medicine_type)
+            VALUES ('内用薬', 'アセチルサリチル酸', '81mg1錠', '小児用アスピリン',
+                'D製薬', 5.7, '後発品')
+            """
+        )
+        conn.execute("INSERT INTO medicines_fts (medicines_fts) VALUES ('rebuild')")
+
+    results = medicine_db.search_medicines("アスピリン", limit=1)
+    assert [r["medicine_name"] for r in results] == ["アスピリン錠100mg"]
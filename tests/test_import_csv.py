@@ -0,0 +1,25 @@
+"""
+CSVImporterのテスト
+"""
+
+import pandas as pd
+
+from rx_scanner.database.db_manager import DatabaseManager
+from rx_scanner.database.import_csv import CSVImporter
+
+
+def test_parse_price_column_strips_separators_and_whitespace(tmp_path):
+    """カンマ・タブ・全角スペースを除去し、変換できない値は0.0にする"""
+    db = DatabaseManager(str(tmp_path / "medicine_data.db"))
+    try:
+        importer = CSVImporter(db)
+        prices = pd.Series(
+            [" 1,234.5 ", "12　3", "7\t5", "", None, "不明"], dtype="string"
+        )
+
+        parsed = importer._parse_price_column(prices)
+
+        assert parsed.tolist() == [1234.5, 123.0, 75.0, 0.0, 0.0, 0.0]
+        assert parsed.dtype == "float64"
+    finally:
+        db.close()
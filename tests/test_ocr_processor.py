@@ -0,0 +1,218 @@
+"""
+OCRProcessorのテスト
+"""
+
+import time
+
+import cv2
+import numpy as np
+import pytesseract
+import pytest
+
+from rx_scanner.utils import ocr_processor as ocr_processor_module
+from rx_scanner.utils.ocr_processor import OCRProcessor
+
+
+@pytest.fixture
+def ocr_processor(monkeypatch):
+    """DB・Tesseractのパス設定を行わないOCRProcessor"""
+    monkeypatch.setattr(ocr_processor_module, "get_db_manager", lambda: None)
+    monkeypatch.setattr(OCRProcessor, "_setup_tesseract_path", lambda self: None)
+    return OCRProcessor()
+
+
+# pytesseract.image_to_dataのTSV出力のヘッダー
+TSV_HEADER = (
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num"
+    "\tleft\ttop\twidth\theight\tconf\ttext"
+)
+
+
+def _tsv_row(page_num, line_num, conf, text):
+    """TSV出力の単語の行（単語以外の階層の行はconf=-1、text=""）"""
+    return f"5\t{page_num}\t1\t1\t{line_num}\t1\t0\t0\t10\t10\t{conf}\t{text}"
+
+
+def _write_images(tmp_path, widths):
+    """幅の異なる画像を書き出してパスのリストを返す"""
+    image_paths = []
+    for width in widths:
+        image_path = tmp_path / f"prescription_{width}.png"
+        cv2.imwrite(str(image_path), np.full((50, width), 255, dtype=np.uint8))
+        image_paths.append(str(image_path))
+    return image_paths
+
+
+def _medicine(medicine_id, ingredient, specification, confidence):
+    """選択対象の薬剤情報"""
+    return {
+        "id": medicine_id,
+        "ingredient_name": ingredient,
+        "specification": specification,
+        "confidence": confidence,
+    }
+
+
+def _selected_ids(ocr_processor, medicines):
+    """成分ごとに選択された薬剤のID"""
+    return [
+        m["id"] for m in ocr_processor._select_best_medicine_per_ingredient(medicines)
+    ]
+
+
+def test_select_best_prefers_lower_spec_on_equal_confidence(ocr_processor):
+    """信頼度が同じなら規格値が低い方を選ぶ"""
+    medicines = [
+        _medicine(1, "アムロジピン", "10mg1錠", 0.9),
+        _medicine(2, "アムロジピン", "5mg1錠", 0.9),
+        _medicine(3, "ロキソプロフェン", "60mg1錠", 0.8),
+    ]
+
+    assert _selected_ids(ocr_processor, medicines) == [2, 3]
+
+
+def test_select_best_keeps_first_seen_spec_on_equal_spec_value(ocr_processor):
+    """信頼度・規格値が同じなら先に出現した規格を残す"""
+    half_width = _medicine(1, "アムロジピン", "5mg1錠", 0.9)
+    full_width = _medicine(2, "アムロジピン", "５ｍｇ１錠", 0.9)
+
+    assert _selected_ids(ocr_processor, [half_width, full_width]) == [1]
+    assert _selected_ids(ocr_processor, [full_width, half_width]) == [2]
+
+    # 初出順は規格ごとに決まる（後から出現した同じ規格の薬剤も先に出現した扱い）
+    medicines = [
+        _medicine(1, "アムロジピン", "5mg1錠", 0.8),
+        _medicine(2, "アムロジピン", "５ｍｇ１錠", 0.9),
+        _medicine(3, "アムロジピン", "5mg1錠", 0.9),
+    ]
+    assert _selected_ids(ocr_processor, medicines) == [3]
+
+
+def test_select_best_replaces_with_later_higher_confidence_duplicate(ocr_processor):
+    """同じ(成分名, 規格)の後続がより高い信頼度なら置き換え、同じなら先を残す"""
+    medicines = [
+        _medicine(1, "アムロジピン", "5mg1錠", 0.8),
+        _medicine(2, "アムロジピン", "10mg1錠", 0.85),
+        _medicine(3, "アムロジピン", "5mg1錠", 0.95),
+    ]
+    assert _selected_ids(ocr_processor, medicines) == [3]
+
+    medicines = [
+        _medicine(1, "アムロジピン", "5mg1錠", 0.9),
+        _medicine(2, "アムロジピン", "5mg1錠", 0.9),
+    ]
+    assert _selected_ids(ocr_processor, medicines) == [1]
+
+
+def test_extract_text_regions_batch_keeps_input_order(
+    ocr_processor, tmp_path, monkeypatch
+):
+    """完了順に関係なく入力画像の順に結果を返す"""
+    image_paths = _write_images(tmp_path, [100, 200, 300])
+
+    def fake_image_to_data(tesseract_input, **kwargs):
+        # 前処理で2倍に拡大された画像の幅で入力画像を識別し、先の画像ほど遅く返す
+        width = cv2.imread(tesseract_input, cv2.IMREAD_GRAYSCALE).shape[1]
+        time.sleep((600 - width) / 10_000)
+        return "\n".join([TSV_HEADER, _tsv_row(1, 1, 90, f"W{width}")])
+
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+    monkeypatch.setattr(OCRProcessor, "OCR_MAX_WORKERS", 3)
+
+    assert ocr_processor.extract_text_regions_batch(image_paths) == [
+        [("W200", 1)],
+        [("W400", 1)],
+        [("W600", 1)],
+    ]
+
+
+def test_extract_text_regions_batch_propagates_errors(
+    ocr_processor, tmp_path, monkeypatch
+):
+    """いずれかの画像のOCRが失敗した場合は例外を送出する"""
+    image_paths = _write_images(tmp_path, [100, 200])
+
+    def fake_image_to_data(tesseract_input, **kwargs):
+        width = cv2.imread(tesseract_input, cv2.IMREAD_GRAYSCALE).shape[1]
+        if width == 400:
+            raise pytesseract.TesseractError(1, "failed")
+        return "\n".join([TSV_HEADER, _tsv_row(1, 1, 90, "W200")])
+
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+
+    with pytest.raises(pytesseract.TesseractError):
+        ocr_processor.extract_text_regions_batch(image_paths)
+    assert ocr_processor.extract_text_regions_batch([]) == []
+
+
+def test_ocr_words_routes_pages_and_filters_words(ocr_processor, monkeypatch):
+    """一覧ファイルのページ番号で画像に振り分け、低信頼度・空の行を除外する"""
+    calls = []
+
+    def fake_image_to_data(tesseract_input, **kwargs):
+        with open(tesseract_input, encoding="utf-8") as f:
+            calls.append((tesseract_input, f.read().splitlines()))
+        return "\n".join(
+            [
+                TSV_HEADER,
+                "1\t1\t0\t0\t0\t0\t0\t0\t100\t100\t-1\t",  # ページ（テキストなし）
+                _tsv_row(1, 1, 91.5, "アムロジピン"),
+                _tsv_row(1, 1, 20, "ノイズ"),  # 信頼度30未満
+                _tsv_row(1, 2, 85, "  "),  # 空白のみ
+                "2\t2\t1\t0\t0\t0\t0\t0\t100\t100\t-1",  # テキスト列の欠落
+                _tsv_row(2, 3, 30, "ロキソニン"),
+            ]
+        )
+
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+    images = [np.full((20, 40), 255, dtype=np.uint8) for _ in range(2)]
+
+    words = ocr_processor._ocr_words(images)
+
+    assert words == [("アムロジピン", 1, 0), ("ロキソニン", 3, 1)]
+
+    # 複数画像はパスの一覧ファイルにまとめて1回で渡す
+    [(tesseract_input, listed_paths)] = calls
+    assert tesseract_input.endswith(".txt")
+    assert [path.rsplit("_", 1)[-1] for path in listed_paths] == ["0.pgm", "1.pgm"]
+
+
+def test_ocr_words_passes_single_image_as_path(ocr_processor, monkeypatch):
+    """1枚の場合は一覧ファイルを作らず画像のパスを直接渡す"""
+    inputs = []
+
+    def fake_image_to_data(tesseract_input, **kwargs):
+        inputs.append(tesseract_input)
+        return "\n".join([TSV_HEADER, _tsv_row(1, 4, 95, "錠")])
+
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+    image = np.full((20, 40), 255, dtype=np.uint8)
+
+    assert ocr_processor._extract_text_regions(image) == [("錠", 4)]
+    assert len(inputs) == 1
+    assert inputs[0].endswith(".pgm")
+
+
+def test_process_images_parses_each_image_separately(
+    ocr_processor, tmp_path, monkeypatch
+):
+    """1回のOCR結果を画像ごとのテキスト領域に分けて解析する"""
+    image_paths = _write_images(tmp_path, [100, 200, 300])
+
+    def fake_image_to_data(tesseract_input, **kwargs):
+        # 2枚目の画像からは単語が抽出されない
+        return "\n".join(
+            [TSV_HEADER, _tsv_row(1, 1, 90, "処方"), _tsv_row(3, 2, 90, "錠")]
+        )
+
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+    monkeypatch.setattr(
+        ocr_processor, "_parse_prescription_text", lambda text_regions: text_regions
+    )
+
+    assert ocr_processor.process_images(image_paths) == [
+        [("処方", 1)],
+        [],
+        [("錠", 2)],
+    ]
+    assert ocr_processor.process_images([]) == []
@@ -0,0 +1,73 @@
+"""
+PrescriptionTabのテスト
+"""
+
+import csv
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from rx_scanner.ui import prescription_tab as prescription_tab_module  # noqa: E402
+from rx_scanner.ui.prescription_tab import PrescriptionTab  # noqa: E402
+
+
+@pytest.fixture
+def prescription_tab():
+    """PrescriptionTab（終了時にワーカースレッドを停止）"""
+    app = QApplication.instance() or QApplication([])
+    tab = PrescriptionTab()
+    yield tab
+    tab.shutdown()
+    tab.deleteLater()
+    app.processEvents()
+
+
+def test_export_csv_writes_confirmed_items(prescription_tab, tmp_path, monkeypatch):
+    """確定リストの各行に保持した薬剤名・分類・薬価をCSVに出力する"""
+    csv_path = tmp_path / "prescription_data.csv"
+    messages = []
+
+    monkeypatch.setattr(
+        prescription_tab_module.QFileDialog,
+        "getSaveFileName",
+        lambda *args: (str(csv_path), ""),
+    )
+    monkeypatch.setattr(
+        prescription_tab_module.QMessageBox,
+        "information",
+        lambda *args: messages.append(("information", args[2])),
+    )
+    monkeypatch.setattr(
+        prescription_tab_module.QMessageBox,
+        "critical",
+        lambda *args: messages.append(("critical", args[2])),
+    )
+    statusbar = SimpleNamespace(showMessage=lambda message: None)
+    monkeypatch.setattr(
+        prescription_tab, "window", lambda: SimpleNamespace(statusbar=statusbar)
+    )
+
+    prescription_tab.add_confirmed_item(
+        "✓ アスピリン錠100mg [先発品] (¥5.70)",
+        {"medicine_name": "アスピリン錠100mg", "medicine_type": "先発品", "price": 5.7},
+    )
+    prescription_tab.add_confirmed_item(
+        "✓ 院内製剤",
+        {"medicine_name": "院内製剤", "medicine_type": None, "price": 0},
+    )
+
+    prescription_tab.on_export_csv()
+
+    assert [kind for kind, _ in messages] == ["information"]
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["薬剤名", "分類", "薬価", "用法", "用量", "日数", "備考"],
+        ["アスピリン錠100mg", "先発品", "5.70", "", "", "", ""],
+        ["院内製剤", "", "", "", "", "", ""],
+    ]
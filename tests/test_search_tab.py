@@ -0,0 +1,64 @@
+"""
+SearchTabのテスト
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from rx_scanner.ui.search_tab import SearchTab
+
+# 絞り込みの確認用に追加する薬剤（前方一致・途中一致・成分名のみ一致を含む）
+EXTRA_MEDICINES = [
+    ("アセチルサリチル酸", "小児用アスピリン錠"),
+    ("アスピリン", "バイアスピリン錠100mg"),
+    ("アスピラ", "アスピラ錠"),
+]
+
+
+def _is_prefix_match(medicine, term):
+    """薬剤名・成分名のいずれかが語で始まるか"""
+    names = (medicine["medicine_name"], medicine["ingredient_name"])
+    return any(name.startswith(term) for name in names)
+
+
+@pytest.mark.parametrize(
+    ("previous_query", "query"),
+    [
+        ("アスピ", "アスピリン"),  # FTS（トライグラム）検索からの絞り込み
+        ("アス", "アス 錠"),  # 3文字未満の語を含むLIKE検索からの絞り込み
+    ],
+)
+def test_narrow_results_matches_db_search(medicine_db, previous_query, query):
+    """前回の結果の絞り込みがDBの再検索と同じ薬剤・前方一致順になる"""
+    with medicine_db.get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO medicines (classification, ingredient_name, specification,
+                medicine_name, manufacturer, price, medicine_type)
+            VALUES ('内用薬', ?, '1錠', ?, 'D製薬', 5.7, '後発品')
+            """,
+            EXTRA_MEDICINES,
+        )
+        conn.execute("INSERT INTO medicines_fts (medicines_fts) VALUES ('rebuild')")
+
+    previous_results = medicine_db.search_medicines(
+        previous_query, SearchTab.SEARCH_LIMIT
+    )
+    search_tab = SimpleNamespace(
+        _last_query=previous_query,
+        _last_results=previous_results,
+        SEARCH_LIMIT=SearchTab.SEARCH_LIMIT,
+    )
+    assert SearchTab._can_narrow_results(search_tab, query)
+
+    narrowed = SearchTab._narrow_results(search_tab, query)
+    expected = medicine_db.search_medicines(query, SearchTab.SEARCH_LIMIT)
+
+    assert expected
+    assert {m["id"] for m in narrowed} == {m["id"] for m in expected}
+
+    first_term = query.split()[0]
+    assert [_is_prefix_match(m, first_term) for m in narrowed] == [
+        _is_prefix_match(m, first_term) for m in expected
+    ]